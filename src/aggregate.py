@@ -291,8 +291,8 @@ class ResultAggregator:
             platform_results={},
         )
 
-    def save_results(self, aggregated: AggregatedResults, output_dir: Path) -> None:
-        """Save aggregated results to disk."""
+    def save_results(self, aggregated: AggregatedResults, output_dir: Path, *, msgpack: bool = False) -> None:
+        """Save aggregated results to disk, additionally as msgpack when requested."""
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # Save as msgspec JSON
@@ -300,6 +300,11 @@ class ResultAggregator:
         with open(results_path, "wb") as f:
             f.write(msgspec.json.encode(aggregated))
 
+        # msgpack copy, smaller and faster to decode for visualization
+        if msgpack:
+            with open(output_dir / "aggregated_results.msgpack", "wb") as f:
+                f.write(msgspec.msgpack.encode(aggregated))
+
         # Also save summaries separately for easier access
         summaries = []
         for fw_summaries in aggregated.framework_summaries.values():
@@ -23,7 +23,7 @@ from .types import (
     FileType,
     Framework,
 )
-from .visualize import BenchmarkVisualizer
+from .visualize import DEFAULT_DPI, BenchmarkVisualizer
 
 console = Console()
 
@@ -238,7 +238,8 @@ def benchmark(  # noqa: PLR0915, C901, PLR0912, PLR0913
     default="aggregated-results",
     help="Output directory for aggregated results",
 )
-def aggregate(input_dirs: tuple[Path, ...], output_dir: Path) -> None:
+@click.option("--msgpack", is_flag=True, help="Also save aggregated results as msgpack")
+def aggregate(input_dirs: tuple[Path, ...], output_dir: Path, msgpack: bool) -> None:
     """Aggregate results from multiple benchmark runs."""
     console.print("[bold blue]Aggregating benchmark results...[/bold blue]")
 
@@ -266,7 +267,7 @@ def aggregate(input_dirs: tuple[Path, ...], output_dir: Path) -> None:
 
         # Save aggregated results
         output_dir.mkdir(parents=True, exist_ok=True)
-        aggregator.save_results(aggregated, output_dir)
+        aggregator.save_results(aggregated, output_dir, msgpack=msgpack)
 
         console.print(f"[green]✓ Results aggregated to {output_dir}[/green]")
     except Exception as e:
@@ -370,7 +371,7 @@ def report(aggregated_file: Path | None, output_dir: Path, output_formats: tuple
     "--aggregated-file",
     "-a",
     type=click.Path(exists=True, file_okay=True, dir_okay=False, path_type=Path),
-    help="Path to aggregated results JSON file",
+    help="Path to aggregated results JSON or msgpack file",
 )
 @click.option(
     "--output-dir",
@@ -379,13 +380,24 @@ def report(aggregated_file: Path | None, output_dir: Path, output_formats: tuple
     default="visualizations",
     help="Output directory for generated visualizations",
 )
-def visualize(aggregated_file: Path | None, output_dir: Path) -> None:
+@click.option(
+    "--dpi",
+    type=int,
+    default=DEFAULT_DPI,
+    help="Resolution (DPI) of the generated PNG charts",
+)
+@click.option(
+    "--use-cache",
+    is_flag=True,
+    help="Reuse charts and summary metrics generated since the aggregated file last changed",
+)
+def visualize(aggregated_file: Path | None, output_dir: Path, dpi: int, use_cache: bool) -> None:
     """Generate comprehensive visualizations from benchmark results."""
     console.print("[bold blue]Generating benchmark visualizations...[/bold blue]")
 
     from .visualize import BenchmarkVisualizer
 
-    visualizer = BenchmarkVisualizer(output_dir)
+    visualizer = BenchmarkVisualizer(output_dir, dpi=dpi)
 
     try:
         # Find aggregated file if not provided
@@ -398,7 +410,7 @@ def visualize(aggregated_file: Path | None, output_dir: Path) -> None:
                 sys.exit(1)
 
         # Generate all visualizations
-        generated_files = visualizer.generate_all_visualizations(aggregated_file)
+        generated_files = visualizer.generate_all_visualizations(aggregated_file, use_cache=use_cache)
 
         console.print(f"[green]✓ Generated {len(generated_files)} visualizations:[/green]")
         for file_path in generated_files:
@@ -407,7 +419,7 @@ def visualize(aggregated_file: Path | None, output_dir: Path) -> None:
         # Generate summary metrics for README
         import json
 
-        summary = visualizer.generate_summary_metrics(aggregated_file)
+        summary = visualizer.generate_summary_metrics(aggregated_file, use_cache=use_cache)
         summary_file = output_dir / "summary_metrics.json"
         with open(summary_file, "w") as f:
             json.dump(summary, f, indent=2)
@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
+import csv
+import multiprocessing
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, wait
+from functools import cached_property, lru_cache
+from operator import attrgetter
 from pathlib import Path
 
 if sys.version_info >= (3, 13):
@@ -10,16 +16,102 @@ if sys.version_info >= (3, 13):
 else:
     pass
 
-import matplotlib.pyplot as plt
-import pandas as pd
-import seaborn as sns
+from typing import TYPE_CHECKING
+
 from rich.console import Console
 from rich.table import Table
 
 from .types import BenchmarkResult, BenchmarkSummary, ExtractionStatus
 
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    import pandas as pd
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
 console = Console()
 
+_ALL_FORMATS = frozenset(
+    {
+        ".pdf",
+        ".docx",
+        ".pptx",
+        ".xlsx",
+        ".xls",
+        ".html",
+        ".md",
+        ".txt",
+        ".csv",
+        ".json",
+        ".yaml",
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".bmp",
+        ".eml",
+        ".msg",
+        ".odt",
+        ".rst",
+        ".org",
+    }
+)
+
+_RESULTS_CSV_HEADER = (
+    "framework",
+    "file_type",
+    "file_path",
+    "file_size_bytes",
+    "extraction_time_seconds",
+    "memory_peak_mb",
+    "cpu_percent",
+    "success",
+    "error_message",
+    "extracted_text_length",
+)
+
+# Batched field access for building the tabular exports row by row
+_RESULT_FIELDS = attrgetter(
+    "framework",
+    "file_type",
+    "file_path",
+    "file_size",
+    "extraction_time",
+    "peak_memory_mb",
+    "avg_cpu_percent",
+    "status",
+    "error_message",
+    "character_count",
+)
+_SUMMARY_FIELDS = attrgetter(
+    "framework",
+    "file_type",
+    "total_files",
+    "successful_extractions",
+    "failed_extractions",
+    "average_time_seconds",
+    "median_time_seconds",
+    "min_time_seconds",
+    "max_time_seconds",
+    "average_memory_mb",
+    "average_cpu_percent",
+    "total_time_seconds",
+)
+_CHART_FIELDS = attrgetter(
+    "framework",
+    "file_type",
+    "successful_extractions",
+    "average_time_seconds",
+    "average_memory_mb",
+    "average_cpu_percent",
+)
+
+# Below this many plotted summaries the charts are rendered inline: starting the chart workers takes as long as
+# rendering all four charts in-process
+_PARALLEL_CHART_MIN_ROWS = 100
+
+COLORBLIND_PALETTE = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b", "#e377c2", "#7f7f7f"]
+
 
 class BenchmarkReporter:
     """Generate reports and visualizations from benchmark results."""
@@ -34,6 +126,14 @@ class BenchmarkReporter:
         self.results = results
         self.summaries = summaries
 
+    @cached_property
+    def _success_rates(self) -> list[float]:
+        """Success rate per summary, computed once and shared by the table, CSV and charts."""
+        return [
+            summary.successful_extractions / summary.total_files if summary.total_files > 0 else 0.0
+            for summary in self.summaries
+        ]
+
     def print_summary_table(self) -> None:
         """Print a summary table to the console."""
         table = Table(title="Benchmark Results Summary")
@@ -46,22 +146,29 @@ class BenchmarkReporter:
         table.add_column("Avg Memory (MB)", justify="right")
         table.add_column("Avg CPU (%)", justify="right")
 
-        for summary in self.summaries:
-            success_rate = (
-                f"{summary.successful_extractions / summary.total_files * 100:.1f}%"
-                if summary.total_files > 0
-                else "0.0%"
-            )
-
-            table.add_row(
-                summary.framework.value,
-                summary.file_type.value,
-                str(summary.total_files),
-                success_rate,
-                f"{summary.average_time_seconds:.2f}",
-                f"{summary.average_memory_mb:.1f}",
-                f"{summary.average_cpu_percent:.1f}",
+        if self.summaries:
+            import numpy as np
+
+            # Format each numeric column in one vectorized call instead of per-cell f-strings
+            count = len(self.summaries)
+            summaries = self.summaries
+            rates = np.fromiter(self._success_rates, dtype=float, count=count)
+            avg_time = np.fromiter((s.average_time_seconds for s in summaries), dtype=float, count=count)
+            avg_memory = np.fromiter((s.average_memory_mb for s in summaries), dtype=float, count=count)
+            avg_cpu = np.fromiter((s.average_cpu_percent for s in summaries), dtype=float, count=count)
+
+            rows = zip(
+                (s.framework.value for s in summaries),
+                (s.file_type.value for s in summaries),
+                (str(s.total_files) for s in summaries),
+                np.char.mod("%.1f%%", rates * 100).tolist(),
+                np.char.mod("%.2f", avg_time).tolist(),
+                np.char.mod("%.1f", avg_memory).tolist(),
+                np.char.mod("%.1f", avg_cpu).tolist(),
+                strict=True,
             )
+            for row in rows:
+                table.add_row(*row)
 
         console.print(table)
 
@@ -81,32 +188,10 @@ class BenchmarkReporter:
         support_table.add_column("Excluded Formats", style="red")
         support_table.add_column("Supported", style="green", justify="right")
 
-        all_formats = {
-            ".pdf",
-            ".docx",
-            ".pptx",
-            ".xlsx",
-            ".xls",
-            ".html",
-            ".md",
-            ".txt",
-            ".csv",
-            ".json",
-            ".yaml",
-            ".png",
-            ".jpg",
-            ".jpeg",
-            ".bmp",
-            ".eml",
-            ".msg",
-            ".odt",
-            ".rst",
-            ".org",
-        }
-
+        supported_counts = _supported_format_counts()
         for framework, exclusions in FRAMEWORK_EXCLUSIONS.items():
             excluded = ", ".join(sorted(exclusions))
-            supported_count = len(all_formats - exclusions)
+            supported_count = supported_counts[framework]
             support_table.add_row(
                 framework.replace("_", " ").title(), excluded if excluded else "None", f"{supported_count}/20"
             )
@@ -119,25 +204,36 @@ class BenchmarkReporter:
         Args:
             output_path: Path to save the CSV file.
         """
-        df = pd.DataFrame(
-            [
-                {
-                    "framework": result.framework.value,
-                    "file_type": result.file_type.value,
-                    "file_path": result.file_path,
-                    "file_size_bytes": result.file_size,
-                    "extraction_time_seconds": result.extraction_time,
-                    "memory_peak_mb": result.peak_memory_mb,
-                    "cpu_percent": result.avg_cpu_percent,
-                    "success": result.status == ExtractionStatus.SUCCESS,
-                    "error_message": result.error_message,
-                    "extracted_text_length": result.character_count,
-                }
-                for result in self.results
-            ]
-        )
+        with open(output_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(_RESULTS_CSV_HEADER)
+            writer.writerows(
+                (
+                    framework.value,
+                    file_type.value,
+                    file_path,
+                    file_size,
+                    extraction_time,
+                    peak_memory_mb,
+                    avg_cpu_percent,
+                    status == ExtractionStatus.SUCCESS,
+                    error_message,
+                    character_count,
+                )
+                for (
+                    framework,
+                    file_type,
+                    file_path,
+                    file_size,
+                    extraction_time,
+                    peak_memory_mb,
+                    avg_cpu_percent,
+                    status,
+                    error_message,
+                    character_count,
+                ) in map(_RESULT_FIELDS, self.results)
+            )
 
-        df.to_csv(output_path, index=False)
         console.print(f"Results saved to: {output_path}")
 
     def save_summary_csv(self, output_path: str | Path) -> None:
@@ -146,27 +242,30 @@ class BenchmarkReporter:
         Args:
             output_path: Path to save the CSV file.
         """
-        df = pd.DataFrame(
+        import pandas as pd
+
+        df = pd.DataFrame.from_records(
             [
-                {
-                    "framework": summary.framework.value,
-                    "file_type": summary.file_type.value,
-                    "total_files": summary.total_files,
-                    "successful_extractions": summary.successful_extractions,
-                    "failed_extractions": summary.failed_extractions,
-                    "success_rate": summary.successful_extractions / summary.total_files
-                    if summary.total_files > 0
-                    else 0.0,
-                    "average_time_seconds": summary.average_time_seconds,
-                    "median_time_seconds": summary.median_time_seconds,
-                    "min_time_seconds": summary.min_time_seconds,
-                    "max_time_seconds": summary.max_time_seconds,
-                    "average_memory_mb": summary.average_memory_mb,
-                    "average_cpu_percent": summary.average_cpu_percent,
-                    "total_time_seconds": summary.total_time_seconds,
-                }
-                for summary in self.summaries
-            ]
+                (framework.value, file_type.value, total_files, successful, failed, success_rate, *timings)
+                for (framework, file_type, total_files, successful, failed, *timings), success_rate in zip(
+                    map(_SUMMARY_FIELDS, self.summaries), self._success_rates, strict=True
+                )
+            ],
+            columns=[
+                "framework",
+                "file_type",
+                "total_files",
+                "successful_extractions",
+                "failed_extractions",
+                "success_rate",
+                "average_time_seconds",
+                "median_time_seconds",
+                "min_time_seconds",
+                "max_time_seconds",
+                "average_memory_mb",
+                "average_cpu_percent",
+                "total_time_seconds",
+            ],
         )
 
         df.to_csv(output_path, index=False)
@@ -178,161 +277,229 @@ class BenchmarkReporter:
         Args:
             output_dir: Directory to save chart files.
         """
+        import numpy as np
+        import pandas as pd
+
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        # Set up matplotlib style with colorblind-accessible colors
-        plt.style.use("seaborn-v0_8")
-        # Use colorblind-friendly palette: blue/orange instead of green/red
-        colorblind_palette = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b", "#e377c2", "#7f7f7f"]
-        sns.set_palette(colorblind_palette)
-
         # Create DataFrame from summaries for easier plotting
-        df = pd.DataFrame(
+        summary_rows = list(map(_CHART_FIELDS, self.summaries))
+        df = pd.DataFrame.from_records(
             [
-                {
-                    "framework": summary.framework.value,
-                    "file_type": summary.file_type.value,
-                    "average_time_seconds": summary.average_time_seconds,
-                    "average_memory_mb": summary.average_memory_mb,
-                    "average_cpu_percent": summary.average_cpu_percent,
-                    "success_rate": summary.successful_extractions / summary.total_files
-                    if summary.total_files > 0
-                    else 0.0,
-                }
-                for summary in self.summaries
-                if summary.successful_extractions > 0  # Only include successful runs
-            ]
+                (framework.value, file_type.value, avg_time, avg_memory, avg_cpu, success_rate)
+                for (framework, file_type, successful, avg_time, avg_memory, avg_cpu), success_rate in zip(
+                    summary_rows, self._success_rates, strict=True
+                )
+                if successful > 0  # Only include successful runs
+            ],
+            columns=[
+                "framework",
+                "file_type",
+                "average_time_seconds",
+                "average_memory_mb",
+                "average_cpu_percent",
+                "success_rate",
+            ],
         )
 
         if df.empty:
             console.print("No successful results to plot")
             return
 
-        # 1. Performance Time Comparison
-        self._create_time_comparison_chart(df, output_path)
-
-        # 2. Memory Usage Comparison
-        self._create_memory_comparison_chart(df, output_path)
+        # Fill the file type x framework success rate matrix directly, skipping a DataFrame pivot
+        frameworks = sorted({framework.value for framework, *_ in summary_rows})
+        file_types = sorted({file_type.value for _, file_type, *_ in summary_rows})
+        framework_index = {framework: i for i, framework in enumerate(frameworks)}
+        file_type_index = {file_type: i for i, file_type in enumerate(file_types)}
+        success_matrix = np.full((len(file_types), len(frameworks)), np.nan)
+        for (framework, file_type, *_), success_rate in zip(summary_rows, self._success_rates, strict=True):
+            success_matrix[file_type_index[file_type.value], framework_index[framework.value]] = success_rate
+        success_pivot = pd.DataFrame(
+            success_matrix,
+            index=pd.Index(file_types, name="file_type"),
+            columns=pd.Index(frameworks, name="framework"),
+        )
 
-        # 3. Success Rate Comparison
-        self._create_success_rate_chart(df, output_path)
+        chart_jobs = [
+            (_create_time_comparison_chart, df),
+            (_create_memory_comparison_chart, df),
+            (_create_success_rate_chart, success_pivot),
+            (_create_performance_heatmap, df),
+        ]
+        max_workers = min(len(chart_jobs), os.cpu_count() or 1)
+        if max_workers == 1 or len(df) < _PARALLEL_CHART_MIN_ROWS:
+            _init_chart_style()
+            try:
+                for job, data in chart_jobs:
+                    job(data, output_path)
+            finally:
+                _close_chart_figure()
+            console.print(f"Charts saved to: {output_path}")
+            return
 
-        # 4. Overall Performance Heatmap
-        self._create_performance_heatmap(df, output_path)
+        # Larger result sets render the independent charts in parallel worker processes
+        mp_context = multiprocessing.get_context("forkserver" if sys.platform == "linux" else "spawn")
+        if sys.platform == "linux":
+            # Import the plotting stack once in the fork server rather than in every worker
+            mp_context.set_forkserver_preload([__name__, "pandas", "seaborn"])
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=mp_context, initializer=_init_chart_style
+        ) as executor:
+            futures = [executor.submit(job, data, output_path) for job, data in chart_jobs]
+            wait(futures)
+            for future in futures:
+                future.result()
 
         console.print(f"Charts saved to: {output_path}")
 
-    def _create_time_comparison_chart(self, df: pd.DataFrame, output_path: Path) -> None:
-        """Create extraction time comparison chart."""
-        plt.figure(figsize=(12, 8))
-        pivot_df = df.pivot(index="file_type", columns="framework", values="average_time_seconds")
-
-        ax = pivot_df.plot(kind="bar", figsize=(12, 8))
-        plt.title("Average Extraction Time by Framework and File Type")
-        plt.xlabel("File Type")
-        plt.ylabel("Average Time (seconds)")
-        plt.xticks(rotation=45)
-        plt.legend(title="Framework", bbox_to_anchor=(1.05, 1), loc="upper left")
-        plt.tight_layout()
-
-        plt.savefig(output_path / "extraction_time_comparison.png", dpi=300, bbox_inches="tight")
-        plt.close()
-
-    def _create_memory_comparison_chart(self, df: pd.DataFrame, output_path: Path) -> None:
-        """Create memory usage comparison chart."""
-        plt.figure(figsize=(12, 8))
-        pivot_df = df.pivot(index="file_type", columns="framework", values="average_memory_mb")
-
-        ax = pivot_df.plot(kind="bar", figsize=(12, 8))
-        plt.title("Average Memory Usage by Framework and File Type")
-        plt.xlabel("File Type")
-        plt.ylabel("Average Memory (MB)")
-        plt.xticks(rotation=45)
-        plt.legend(title="Framework", bbox_to_anchor=(1.05, 1), loc="upper left")
-        plt.tight_layout()
-
-        plt.savefig(output_path / "memory_usage_comparison.png", dpi=300, bbox_inches="tight")
-        plt.close()
-
-    def _create_success_rate_chart(self, df: pd.DataFrame, output_path: Path) -> None:
-        """Create success rate comparison chart."""
-        # Calculate success rates from original summaries
-        success_data = []
-        for summary in self.summaries:
-            success_rate = summary.successful_extractions / summary.total_files if summary.total_files > 0 else 0.0
-            success_data.append(
-                {
-                    "framework": summary.framework.value,
-                    "file_type": summary.file_type.value,
-                    "success_rate": success_rate,
-                }
-            )
 
-        success_df = pd.DataFrame(success_data)
-        pivot_df = success_df.pivot(index="file_type", columns="framework", values="success_rate")
+@lru_cache(maxsize=1)
+def _supported_format_counts() -> dict[str, int]:
+    """Count the supported formats of each framework once per process."""
+    from .config import FRAMEWORK_EXCLUSIONS
 
-        plt.figure(figsize=(12, 8))
-        ax = pivot_df.plot(kind="bar", figsize=(12, 8))
-        plt.title("Success Rate by Framework and File Type")
-        plt.xlabel("File Type")
-        plt.ylabel("Success Rate")
-        plt.xticks(rotation=45)
-        plt.ylim(0, 1.05)
-        plt.legend(title="Framework", bbox_to_anchor=(1.05, 1), loc="upper left")
+    return {framework: len(_ALL_FORMATS - exclusions) for framework, exclusions in FRAMEWORK_EXCLUSIONS.items()}
 
-        # Format y-axis as percentage
-        from matplotlib.ticker import FuncFormatter
 
-        ax.yaxis.set_major_formatter(FuncFormatter(lambda y, _: f"{y:.0%}"))
+@lru_cache(maxsize=1)
+def _pyplot() -> ModuleType:
+    """Import pyplot on the non-interactive Agg backend on first use."""
+    import matplotlib as mpl
 
-        plt.tight_layout()
-        plt.savefig(output_path / "success_rate_comparison.png", dpi=300, bbox_inches="tight")
-        plt.close()
+    mpl.use("Agg")
 
-    def _create_performance_heatmap(self, df: pd.DataFrame, output_path: Path) -> None:
-        """Create performance heatmap."""
-        # Normalize metrics to 0-1 scale for comparison
-        metrics_df = df.copy()
+    import matplotlib.pyplot as plt
 
-        # Lower time is better, so invert
-        if not metrics_df.empty and metrics_df["average_time_seconds"].max() > 0:
-            metrics_df["time_score"] = 1 - (
-                metrics_df["average_time_seconds"] / metrics_df["average_time_seconds"].max()
-            )
-        else:
-            metrics_df["time_score"] = 0
+    return plt
 
-        # Lower memory is better, so invert
-        if not metrics_df.empty and metrics_df["average_memory_mb"].max() > 0:
-            metrics_df["memory_score"] = 1 - (metrics_df["average_memory_mb"] / metrics_df["average_memory_mb"].max())
-        else:
-            metrics_df["memory_score"] = 0
 
-        # Success rate is already 0-1
-        metrics_df["success_score"] = metrics_df["success_rate"]
+@lru_cache(maxsize=1)
+def _chart_figure() -> Figure:
+    """Create the figure that a chart worker reuses for every chart it renders."""
+    return _pyplot().figure(figsize=(12, 8))
 
-        # Calculate overall performance score
-        metrics_df["overall_score"] = (
-            metrics_df["time_score"] * 0.4 + metrics_df["memory_score"] * 0.3 + metrics_df["success_score"] * 0.3
-        )
 
-        # Create heatmap
-        heatmap_data = metrics_df.pivot(index="file_type", columns="framework", values="overall_score")
-
-        plt.figure(figsize=(12, 8))
-        sns.heatmap(
-            heatmap_data,
-            annot=True,
-            fmt=".2f",
-            cmap="viridis",  # Colorblind-friendly colormap
-            center=0.5,
-            cbar_kws={"label": "Performance Score (Higher is Better)"},
-        )
-        plt.title("Overall Performance Heatmap\n(Weighted: Time 40%, Memory 30%, Success Rate 30%)")
-        plt.xlabel("Framework")
-        plt.ylabel("File Type")
-        plt.tight_layout()
+def _chart_axes() -> Axes:
+    """Clear the worker's reusable figure and return fresh axes on it."""
+    fig = _chart_figure()
+    fig.clear()
+    return fig.add_subplot()
+
+
+def _close_chart_figure() -> None:
+    """Close the reusable figure, if one was created, so it does not outlive the charts rendered on it."""
+    if _chart_figure.cache_info().currsize:
+        _pyplot().close(_chart_figure())
+        _chart_figure.cache_clear()
+
+
+def _init_chart_style() -> None:
+    """Set up matplotlib style with colorblind-accessible colors in a chart worker."""
+    import seaborn as sns
+
+    plt = _pyplot()
+    plt.style.use("seaborn-v0_8")
+    # Use colorblind-friendly palette: blue/orange instead of green/red
+    sns.set_palette(COLORBLIND_PALETTE)
+
+
+def _create_time_comparison_chart(df: pd.DataFrame, output_path: Path) -> None:
+    """Create extraction time comparison chart."""
+    pivot_df = df.pivot(index="file_type", columns="framework", values="average_time_seconds")
+
+    ax = pivot_df.plot(kind="bar", ax=_chart_axes())
+    fig = ax.figure
+    ax.set_title("Average Extraction Time by Framework and File Type")
+    ax.set_xlabel("File Type")
+    ax.set_ylabel("Average Time (seconds)")
+    ax.tick_params(axis="x", rotation=45)
+    ax.legend(title="Framework", bbox_to_anchor=(1.05, 1), loc="upper left")
+    fig.tight_layout()
+
+    fig.savefig(output_path / "extraction_time_comparison.png", dpi=300, bbox_inches="tight")
+
+
+def _create_memory_comparison_chart(df: pd.DataFrame, output_path: Path) -> None:
+    """Create memory usage comparison chart."""
+    pivot_df = df.pivot(index="file_type", columns="framework", values="average_memory_mb")
+
+    ax = pivot_df.plot(kind="bar", ax=_chart_axes())
+    fig = ax.figure
+    ax.set_title("Average Memory Usage by Framework and File Type")
+    ax.set_xlabel("File Type")
+    ax.set_ylabel("Average Memory (MB)")
+    ax.tick_params(axis="x", rotation=45)
+    ax.legend(title="Framework", bbox_to_anchor=(1.05, 1), loc="upper left")
+    fig.tight_layout()
+
+    fig.savefig(output_path / "memory_usage_comparison.png", dpi=300, bbox_inches="tight")
+
+
+def _create_success_rate_chart(pivot_df: pd.DataFrame, output_path: Path) -> None:
+    """Create success rate comparison chart from a file type x framework matrix."""
+    ax = pivot_df.plot(kind="bar", ax=_chart_axes())
+    fig = ax.figure
+    ax.set_title("Success Rate by Framework and File Type")
+    ax.set_xlabel("File Type")
+    ax.set_ylabel("Success Rate")
+    ax.tick_params(axis="x", rotation=45)
+    ax.set_ylim(0, 1.05)
+    ax.legend(title="Framework", bbox_to_anchor=(1.05, 1), loc="upper left")
+
+    # Format y-axis as percentage
+    from matplotlib.ticker import FuncFormatter
+
+    ax.yaxis.set_major_formatter(FuncFormatter(lambda y, _: f"{y:.0%}"))
+
+    fig.tight_layout()
+    fig.savefig(output_path / "success_rate_comparison.png", dpi=300, bbox_inches="tight")
+
+
+def _create_performance_heatmap(df: pd.DataFrame, output_path: Path) -> None:
+    """Create performance heatmap."""
+    import seaborn as sns
+
+    # Normalize metrics to 0-1 scale for comparison
+    metrics_df = df.copy()
+
+    # Lower time is better, so invert
+    if not metrics_df.empty and metrics_df["average_time_seconds"].max() > 0:
+        metrics_df["time_score"] = 1 - (metrics_df["average_time_seconds"] / metrics_df["average_time_seconds"].max())
+    else:
+        metrics_df["time_score"] = 0
 
-        plt.savefig(output_path / "performance_heatmap.png", dpi=300, bbox_inches="tight")
-        plt.close()
+    # Lower memory is better, so invert
+    if not metrics_df.empty and metrics_df["average_memory_mb"].max() > 0:
+        metrics_df["memory_score"] = 1 - (metrics_df["average_memory_mb"] / metrics_df["average_memory_mb"].max())
+    else:
+        metrics_df["memory_score"] = 0
+
+    # Success rate is already 0-1
+    metrics_df["success_score"] = metrics_df["success_rate"]
+
+    # Calculate overall performance score
+    metrics_df["overall_score"] = (
+        metrics_df["time_score"] * 0.4 + metrics_df["memory_score"] * 0.3 + metrics_df["success_score"] * 0.3
+    )
+
+    # Create heatmap
+    heatmap_data = metrics_df.pivot(index="file_type", columns="framework", values="overall_score")
+
+    ax = _chart_axes()
+    fig = ax.figure
+    sns.heatmap(
+        heatmap_data,
+        annot=True,
+        fmt=".2f",
+        cmap="viridis",  # Colorblind-friendly colormap
+        center=0.5,
+        cbar_kws={"label": "Performance Score (Higher is Better)"},
+        ax=ax,
+    )
+    ax.set_title("Overall Performance Heatmap\n(Weighted: Time 40%, Memory 30%, Success Rate 30%)")
+    ax.set_xlabel("Framework")
+    ax.set_ylabel("File Type")
+    fig.tight_layout()
+
+    fig.savefig(output_path / "performance_heatmap.png", dpi=300, bbox_inches="tight")
@@ -2,47 +2,174 @@
 
 from __future__ import annotations
 
+import io
+import os
 import re
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import msgspec
+import numpy as np
 import pandas as pd
 
 from .types import BenchmarkResult, ExtractionStatus
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+# File name keywords of files that likely contain tables
+_TABLE_KEYWORDS = (
+    "table",
+    "spreadsheet",
+    "excel",
+    "csv",
+    "xlsx",
+    "xls",
+    "stanley-cups",
+    "embedded-images-tables",
+    "docx-tables",
+    "word_tables",
+    "tablecell",
+)
+_TABLE_KEYWORD_RE = re.compile("|".join(map(re.escape, _TABLE_KEYWORDS)))
+
+# Table representations checked by _score_structure as (name, pattern, weight, required). Patterns
+# run against the lowered text, so they are written in lowercase and compiled without IGNORECASE.
+# A pattern can only match when its required literal occurs at least that many times in the text.
+_STRUCTURE_PATTERNS: tuple[tuple[str, re.Pattern[str], float, tuple[str, int] | None], ...] = tuple(
+    (name, re.compile(pattern, re.MULTILINE), weight, required)
+    for name, pattern, weight, required in (
+        ("markdown_tables", r"\|.*\|.*\|", 0.25, ("|", 3)),  # Markdown table format
+        ("html_tables", r"<table.*?>.*?</table>", 0.25, ("<table", 1)),  # HTML table tags
+        ("csv_format", r".*,.*,.*", 0.20, (",", 2)),  # CSV-like comma separation
+        ("tab_separated", r".*\t.*\t.*", 0.20, ("\t", 2)),  # Tab-separated values
+        ("aligned_columns", r"  +\w+  +\w+", 0.15, ("  ", 2)),  # Space-aligned columns
+        ("table_headers", r"(name|product|item|price|total|amount|quantity)", 0.10, None),  # Common table headers
+        ("numeric_data", r"\$?\d+\.?\d*", 0.05, None),  # Numeric data (prices, quantities)
+    )
+)
+
+# Format-specific structure bonus by file extension, computed from the lowered text
+_STRUCTURE_FORMAT_BONUS: dict[str, Callable[[str], float]] = {
+    # CSV files should preserve comma structure
+    ".csv": lambda text: 0.3 if "," in text else 0.0,
+    # Excel files should preserve tabular data
+    ".xlsx": lambda text: 0.2 if "\t" in text or "," in text else 0.0,
+    ".xls": lambda text: 0.2 if "\t" in text or "," in text else 0.0,
+    # HTML should preserve table structure
+    ".html": lambda text: 0.2 if "<table>" in text or "|" in text else 0.0,
+}
+
+# Each detection indicator scores min(0.2, matches * 0.05), so counting past 4 matches is wasted work
+_DETECTION_MATCH_CAP = 4
+
+
+def _capped_match_counter(pattern: str, flags: int = 0) -> Callable[[str], int]:
+    """Build a counter of non-overlapping pattern matches that stops at _DETECTION_MATCH_CAP."""
+    compiled = re.compile(pattern, flags)
+    return lambda text: sum(1 for _ in islice(compiled.finditer(text), _DETECTION_MATCH_CAP))
+
+
+# General table indicators counted by _score_detection as (name, match counter, counts lowered text).
+# structured_data runs with IGNORECASE on the original text: lowering can change the text's length
+# (e.g. the Turkish dotted capital I), which would change how its letter runs split into matches.
+_DETECTION_INDICATORS: tuple[tuple[str, Callable[[str], int], bool], ...] = (
+    ("column_headers", _capped_match_counter(r"(product|name|price|total|amount|category|region|quarter)"), True),
+    # Prices, currencies, codes
+    ("structured_data", _capped_match_counter(r"\d+\.\d+|\$\d+|[A-Z]{2,3}", re.IGNORECASE), False),
+    # Common separators: matches of [|,\t] are single characters, so plain counts are exact
+    ("table_separators", lambda text: text.count("|") + text.count(",") + text.count("\t"), True),
+    # Multi-row structure: each match of \n.*\n.*\n consumes exactly three newlines
+    ("row_structure", lambda text: text.count("\n") // 3, True),
+)
+
+# Expected table content of known test files by file name marker; the first matching marker wins
+_EXPECTED_TABLE_CONTENT: dict[str, dict[str, list[str]]] = {
+    "stanley-cups": {
+        "teams": ["blues", "flyers", "maple leafs"],
+        "locations": ["stl", "phi", "tor"],
+        "numbers": ["1", "2", "13"],
+    },
+    "simple-table": {
+        "items": ["juicy apples", "bananas", "laptop", "desk chair"],
+        "prices": ["1.99", "1.89", "999.99", "199.99"],
+        "categories": ["electronics", "furniture", "kitchen"],
+    },
+    "complex-table": {
+        "regions": ["usa", "canada", "uk", "germany", "france"],
+        "quarters": ["q1", "q2", "q3", "q4"],
+        "totals": ["695", "205", "373", "295"],
+    },
+}
+
+# re holds the GIL while matching, so scoring frameworks in threads only pays off without a GIL
+_FREE_THREADED = not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def _occurs_at_least(text: str, literal: str, times: int) -> bool:
+    """Check for ``times`` non-overlapping occurrences of ``literal``, stopping at the last one needed.
+
+    Equivalent to ``text.count(literal) >= times`` without scanning the rest of a long text.
+    """
+    index = -len(literal)
+    for _ in range(times):
+        index = text.find(literal, index + len(literal))
+        if index < 0:
+            return False
+    return True
+
+
+@lru_cache(maxsize=1024)
+def _expected_table_content(file_name: str) -> dict[str, list[str]] | None:
+    """Look up the expected table content for a lowercased file name, once per distinct name."""
+    return next((content for marker, content in _EXPECTED_TABLE_CONTENT.items() if marker in file_name), None)
+
 
 class TableExtractionAnalyzer:
     """Analyze table extraction quality across frameworks."""
 
-    def __init__(self, results: list[BenchmarkResult]) -> None:
-        """Initialize with benchmark results."""
-        self.results = results
+    def __init__(self, results: Iterable[BenchmarkResult], *, release_text: bool = False) -> None:
+        """Initialize with benchmark results.
+
+        Args:
+            results: Benchmark results to analyze, consumed once.
+            release_text: Score each successful extraction as it is consumed and then drop its
+                extracted text, so only one text is held at a time. This mutates the results and
+                is meant for results the analyzer owns, e.g. ones decoded from a results file.
+        """
+        # Lowercased (name, suffix) per distinct file path, parsed once instead of per result
+        self._path_meta: dict[str, tuple[str, str]] = {}
+        # (structure_score, detection_score) per result; self.results keeps each result alive, so id() is stable
+        self._score_cache: dict[int, tuple[float, float]] = {}
+
+        self.results: list[BenchmarkResult] = []
+        for result in results:
+            self._file_meta(result.file_path)
+            if release_text and result.status == ExtractionStatus.SUCCESS and result.extracted_text:
+                self._score_result(result)
+                result.extracted_text = None
+            self.results.append(result)
         self.table_files = self._identify_table_files()
 
-    def _identify_table_files(self) -> list[str]:
+    def _identify_table_files(self) -> frozenset[str]:
         """Identify files that likely contain tables."""
-        table_keywords = [
-            "table",
-            "spreadsheet",
-            "excel",
-            "csv",
-            "xlsx",
-            "xls",
-            "stanley-cups",
-            "embedded-images-tables",
-            "docx-tables",
-            "word_tables",
-            "tablecell",
-        ]
-
-        table_files = []
-        for result in self.results:
-            file_path = Path(result.file_path).name.lower()
-            if any(keyword in file_path for keyword in table_keywords):
-                table_files.append(result.file_path)
+        # Each distinct path is checked once, no matter how many frameworks extracted it
+        return frozenset(
+            file_path for file_path, (file_name, _) in self._path_meta.items() if _TABLE_KEYWORD_RE.search(file_name)
+        )
 
-        return list(set(table_files))
+    def _file_meta(self, file_path: str) -> tuple[str, str]:
+        """Return the lowercased file name and suffix of a path, parsing each path only once."""
+        meta = self._path_meta.get(file_path)
+        if meta is None:
+            path = Path(file_path)
+            meta = self._path_meta[file_path] = (path.name.lower(), path.suffix.lower())
+        return meta
 
     def analyze_table_extraction_quality(self) -> dict[str, Any]:
         """Analyze table extraction quality across frameworks."""
@@ -54,23 +181,27 @@ class TableExtractionAnalyzer:
             "summary": {},
         }
 
-        # Group results by framework and file
-        framework_results = {}
+        # Group results by framework and file in a single pass
+        framework_results: defaultdict[str, list[BenchmarkResult]] = defaultdict(list)
+        results_by_file: defaultdict[str, list[BenchmarkResult]] = defaultdict(list)
         for result in self.results:
             if result.file_path in self.table_files:
-                framework = result.framework.value
-                if framework not in framework_results:
-                    framework_results[framework] = []
-                framework_results[framework].append(result)
-
-        # Analyze each framework
-        for framework, results in framework_results.items():
-            analysis["framework_analysis"][framework] = self._analyze_framework_tables(results)
+                framework_results[result.framework.value].append(result)
+                results_by_file[result.file_path].append(result)
+
+        # Analyze each framework. The frameworks' results are disjoint, so concurrent analyses never
+        # share a score cache entry; map() keeps the first-seen framework order.
+        if _FREE_THREADED and len(framework_results) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(framework_results), os.cpu_count() or 1)) as executor:
+                framework_analyses = executor.map(self._analyze_framework_tables, framework_results.values())
+                analysis["framework_analysis"] = dict(zip(framework_results, framework_analyses, strict=True))
+        else:
+            for framework, results in framework_results.items():
+                analysis["framework_analysis"][framework] = self._analyze_framework_tables(results)
 
         # Analyze each file
         for file_path in self.table_files:
-            file_results = [r for r in self.results if r.file_path == file_path]
-            analysis["file_analysis"][file_path] = self._analyze_file_tables(file_results)
+            analysis["file_analysis"][file_path] = self._analyze_file_tables(results_by_file[file_path])
 
         # Generate summary
         analysis["summary"] = self._generate_table_summary(analysis["framework_analysis"])
@@ -80,7 +211,7 @@ class TableExtractionAnalyzer:
     def _analyze_framework_tables(self, results: list[BenchmarkResult]) -> dict[str, Any]:
         """Analyze table extraction for a specific framework."""
         total_files = len(results)
-        successful_extractions = [r for r in results if r.status == ExtractionStatus.SUCCESS and r.extracted_text]
+        successful_extractions = [r for r in results if r.status == ExtractionStatus.SUCCESS and self._has_text(r)]
 
         analysis = {
             "total_table_files_attempted": total_files,
@@ -93,43 +224,35 @@ class TableExtractionAnalyzer:
         }
 
         # Analyze successful extractions
-        extraction_times = []
+        total_time = 0.0
+        timed_extractions = 0
         for result in successful_extractions:
             if result.extraction_time:
-                extraction_times.append(result.extraction_time)
+                total_time += result.extraction_time
+                timed_extractions += 1
 
             # Analyze table structure preservation
-            if result.extracted_text:
-                structure_score = self._analyze_table_structure(result.extracted_text, result.file_path)
+            if self._has_text(result):
+                structure_score, detection_score = self._score_result(result)
                 analysis["table_structure_scores"].append(structure_score)
-
-                detection_score = self._analyze_table_detection(result.extracted_text, result.file_path)
                 analysis["table_detection_scores"].append(detection_score)
 
-            # Track format support
-            file_ext = Path(result.file_path).suffix.lower()
-            if file_ext not in analysis["format_support"]:
-                analysis["format_support"][file_ext] = {"attempted": 0, "successful": 0}
-            analysis["format_support"][file_ext]["attempted"] += 1
-            if result.status == ExtractionStatus.SUCCESS:
-                analysis["format_support"][file_ext]["successful"] += 1
+        if timed_extractions:
+            analysis["avg_extraction_time"] = total_time / timed_extractions
 
-        if extraction_times:
-            analysis["avg_extraction_time"] = sum(extraction_times) / len(extraction_times)
+        # Track format support, in first-seen extension order; only successful extractions are counted,
+        # so every attempt tallied here also succeeded
+        ext_counts = Counter(self._file_meta(r.file_path)[1] for r in successful_extractions)
+        analysis["format_support"] = {
+            file_ext: {"attempted": count, "successful": count} for file_ext, count in ext_counts.items()
+        }
 
-        if analysis["table_structure_scores"]:
-            analysis["avg_structure_score"] = sum(analysis["table_structure_scores"]) / len(
-                analysis["table_structure_scores"]
-            )
-        else:
-            analysis["avg_structure_score"] = 0
+        # sum()/len() rather than NumPy's pairwise mean, so the published averages keep their exact values
+        structure_scores = analysis["table_structure_scores"]
+        analysis["avg_structure_score"] = sum(structure_scores) / len(structure_scores) if structure_scores else 0
 
-        if analysis["table_detection_scores"]:
-            analysis["avg_detection_score"] = sum(analysis["table_detection_scores"]) / len(
-                analysis["table_detection_scores"]
-            )
-        else:
-            analysis["avg_detection_score"] = 0
+        detection_scores = analysis["table_detection_scores"]
+        analysis["avg_detection_score"] = sum(detection_scores) / len(detection_scores) if detection_scores else 0
 
         return analysis
 
@@ -137,7 +260,7 @@ class TableExtractionAnalyzer:
         """Analyze table extraction for a specific file across frameworks."""
         analysis = {
             "file_path": results[0].file_path if results else "",
-            "file_type": Path(results[0].file_path).suffix.lower() if results else "",
+            "file_type": self._file_meta(results[0].file_path)[1] if results else "",
             "framework_results": {},
             "best_extraction": None,
             "table_complexity": "unknown",
@@ -155,9 +278,8 @@ class TableExtractionAnalyzer:
                 "table_detection_score": 0,
             }
 
-            if result.status == ExtractionStatus.SUCCESS and result.extracted_text:
-                structure_score = self._analyze_table_structure(result.extracted_text, result.file_path)
-                detection_score = self._analyze_table_detection(result.extracted_text, result.file_path)
+            if result.status == ExtractionStatus.SUCCESS and self._has_text(result):
+                structure_score, detection_score = self._score_result(result)
 
                 framework_analysis["table_structure_score"] = structure_score
                 framework_analysis["table_detection_score"] = detection_score
@@ -175,103 +297,76 @@ class TableExtractionAnalyzer:
 
         return analysis
 
-    def _analyze_table_structure(self, extracted_text: str, file_path: str) -> float:
-        """Analyze how well table structure is preserved in extracted text."""
-        if not extracted_text:
-            return 0.0
-
-        score = 0.0
-        file_ext = Path(file_path).suffix.lower()
-
-        # Check for different table representations
-        structure_indicators = {
-            "markdown_tables": r"\|.*\|.*\|",  # Markdown table format
-            "html_tables": r"<table.*?>.*?</table>",  # HTML table tags
-            "csv_format": r".*,.*,.*",  # CSV-like comma separation
-            "tab_separated": r".*\t.*\t.*",  # Tab-separated values
-            "aligned_columns": r"  +\w+  +\w+",  # Space-aligned columns
-            "table_headers": r"(Name|Product|Item|Price|Total|Amount|Quantity)",  # Common table headers
-            "numeric_data": r"\$?\d+\.?\d*",  # Numeric data (prices, quantities)
-        }
+    def _has_text(self, result: BenchmarkResult) -> bool:
+        """Whether a result has extracted text, including text already scored and released."""
+        return bool(result.extracted_text) or id(result) in self._score_cache
 
-        text_lower = extracted_text.lower()
+    def _score_result(self, result: BenchmarkResult) -> tuple[float, float]:
+        """Score a result's extracted text once; the framework and file analyses share the scores."""
+        key = id(result)
+        if key not in self._score_cache:
+            self._score_cache[key] = self._score_text(result.extracted_text or "", result.file_path)
+        return self._score_cache[key]
 
-        for indicator_name, pattern in structure_indicators.items():
-            if re.search(pattern, extracted_text, re.IGNORECASE | re.MULTILINE):
-                if indicator_name in {"markdown_tables", "html_tables"}:
-                    score += 0.25
-                elif indicator_name in {"csv_format", "tab_separated"}:
-                    score += 0.20
-                elif indicator_name == "aligned_columns":
-                    score += 0.15
-                elif indicator_name == "table_headers":
-                    score += 0.10
-                elif indicator_name == "numeric_data":
-                    score += 0.05
-
-        # File-specific scoring adjustments
-        if file_ext == ".csv":
-            # CSV files should preserve comma structure
-            if "," in extracted_text:
-                score += 0.3
-        elif file_ext in [".xlsx", ".xls"]:
-            # Excel files should preserve tabular data
-            if "\t" in extracted_text or "," in extracted_text:
-                score += 0.2
-        elif file_ext == ".html" and ("<table>" in text_lower or "|" in extracted_text):
-            # HTML should preserve table structure
-            score += 0.2
+    def _score_text(self, extracted_text: str, file_path: str) -> tuple[float, float]:
+        """Score table structure preservation and table detection for one extracted text.
 
-        return min(1.0, score)
+        The text is lowered once and both scorers match lowercase patterns against it without
+        IGNORECASE, except for the structured_data indicator, which needs the original text. Patterns whose required literal does not occur often enough in the text are
+        skipped without a regex scan, indicator counting stops once the per-indicator cap is
+        reached, and no further patterns run once a score is capped at 1.0.
 
-    def _analyze_table_detection(self, extracted_text: str, file_path: str) -> float:
-        """Analyze how well tables are detected and extracted."""
+        Returns:
+            Tuple of (structure_score, detection_score), each in the range [0, 1].
+        """
         if not extracted_text:
-            return 0.0
+            return 0.0, 0.0
 
-        score = 0.0
-        file_name = Path(file_path).name.lower()
+        file_name, file_ext = self._file_meta(file_path)
+        text_lower = extracted_text.lower()
 
-        # Expected content based on known test files
-        expected_content = {}
+        return (
+            self._score_structure(text_lower, file_ext),
+            self._score_detection(extracted_text, text_lower, file_name),
+        )
 
-        if "stanley-cups" in file_name:
-            expected_content = {
-                "teams": ["blues", "flyers", "maple leafs"],
-                "locations": ["stl", "phi", "tor"],
-                "numbers": ["1", "2", "13"],
-            }
-        elif "simple-table" in file_name:
-            expected_content = {
-                "items": ["juicy apples", "bananas", "laptop", "desk chair"],
-                "prices": ["1.99", "1.89", "999.99", "199.99"],
-                "categories": ["electronics", "furniture", "kitchen"],
-            }
-        elif "complex-table" in file_name:
-            expected_content = {
-                "regions": ["usa", "canada", "uk", "germany", "france"],
-                "quarters": ["q1", "q2", "q3", "q4"],
-                "totals": ["695", "205", "373", "295"],
-            }
+    def _score_structure(self, text_lower: str, file_ext: str) -> float:
+        """Score how well table structure is preserved in extracted text."""
+        # File-specific scoring adjustments are plain substring checks, so they are known up front
+        # and the pattern ladder can stop as soon as the score reaches the 1.0 cap
+        format_bonus = _STRUCTURE_FORMAT_BONUS.get(file_ext)
+        bonus = format_bonus(text_lower) if format_bonus else 0.0
 
-        # Check for expected content
-        text_lower = extracted_text.lower()
-        for items in expected_content.values():
-            found_items = sum(1 for item in items if item in text_lower)
-            if items:
-                category_score = found_items / len(items)
-                score += category_score * 0.3
-
-        # Check for general table indicators
-        table_indicators = [
-            ("column_headers", r"(product|name|price|total|amount|category|region|quarter)"),
-            ("structured_data", r"\d+\.\d+|\$\d+|[A-Z]{2,3}"),  # Prices, currencies, codes
-            ("table_separators", r"[\|,\t]"),  # Common separators
-            ("row_structure", r"\n.*\n.*\n"),  # Multi-row structure
-        ]
-
-        for _indicator_name, pattern in table_indicators:
-            matches = len(re.findall(pattern, extracted_text, re.IGNORECASE))
+        # Check for different table representations
+        score = 0.0
+        for _indicator_name, pattern, weight, required in _STRUCTURE_PATTERNS:
+            if score + bonus >= 1.0:
+                break
+            if required and not _occurs_at_least(text_lower, *required):
+                continue
+            if pattern.search(text_lower):
+                score += weight
+
+        return min(1.0, score + bonus)
+
+    def _score_detection(self, text: str, text_lower: str, file_name: str) -> float:
+        """Score how well tables are detected and extracted."""
+        score = 0.0
+
+        # Check for expected content based on known test files
+        expected_content = _expected_table_content(file_name)
+        if expected_content is not None:
+            for items in expected_content.values():
+                found_items = sum(1 for item in items if item in text_lower)
+                if items:
+                    category_score = found_items / len(items)
+                    score += category_score * 0.3
+
+        # Check for general table indicators; each contributes at most 0.2, i.e. 4 matches
+        for _indicator_name, count_matches, counts_lowered in _DETECTION_INDICATORS:
+            if score >= 1.0:
+                break
+            matches = count_matches(text_lower if counts_lowered else text)
             if matches > 0:
                 score += min(0.2, matches * 0.05)
 
@@ -279,7 +374,7 @@ class TableExtractionAnalyzer:
 
     def _determine_table_complexity(self, file_path: str) -> str:
         """Determine the complexity level of tables in the file."""
-        file_name = Path(file_path).name.lower()
+        file_name, _ = self._file_meta(file_path)
 
         if "simple" in file_name:
             return "simple"
@@ -306,37 +401,39 @@ class TableExtractionAnalyzer:
             "format_support_matrix": {},
         }
 
-        # Find best frameworks for different metrics
-        best_structure_score = -1
-        best_detection_score = -1
-        best_speed = float("inf")
-
-        for framework, analysis in framework_analysis.items():
-            structure_score = analysis.get("avg_structure_score", 0)
-            detection_score = analysis.get("avg_detection_score", 0)
-            speed = analysis.get("avg_extraction_time", float("inf"))
-
-            if structure_score > best_structure_score:
-                best_structure_score = structure_score
-                summary["best_framework_structure"] = framework
-
-            if detection_score > best_detection_score:
-                best_detection_score = detection_score
-                summary["best_framework_detection"] = framework
-
-            if speed < best_speed and speed > 0:
-                best_speed = speed
-                summary["best_framework_speed"] = framework
-
-            # Create ranking score (structure + detection + speed factor)
-            speed_factor = 1.0 / speed if speed > 0 else 0
-            ranking_score = (structure_score + detection_score) / 2 + speed_factor * 0.1
-            summary["framework_rankings"][framework] = {
+        # Find best frameworks for different metrics (ties go to the first framework, as before)
+        metrics = pd.DataFrame.from_dict(framework_analysis, orient="index").reindex(
+            columns=["avg_structure_score", "avg_detection_score", "avg_extraction_time"]
+        )
+        structure_scores = metrics["avg_structure_score"].fillna(0).astype(float)
+        detection_scores = metrics["avg_detection_score"].fillna(0).astype(float)
+        speeds = metrics["avg_extraction_time"].fillna(float("inf")).astype(float)
+
+        summary["best_framework_structure"] = structure_scores.idxmax()
+        summary["best_framework_detection"] = detection_scores.idxmax()
+        timed_speeds = speeds[(speeds > 0) & np.isfinite(speeds)]
+        if not timed_speeds.empty:
+            summary["best_framework_speed"] = timed_speeds.idxmin()
+
+        # Create ranking score (structure + detection + speed factor)
+        speed_factors = np.divide(1.0, speeds, out=np.zeros(len(speeds)), where=speeds > 0)
+        ranking_scores = (structure_scores + detection_scores) / 2 + speed_factors * 0.1
+        summary["framework_rankings"] = {
+            framework: {
                 "structure_score": structure_score,
                 "detection_score": detection_score,
                 "speed": speed,
                 "ranking_score": ranking_score,
             }
+            for framework, structure_score, detection_score, speed, ranking_score in zip(
+                metrics.index,
+                structure_scores.tolist(),
+                detection_scores.tolist(),
+                speeds.tolist(),
+                ranking_scores.tolist(),
+                strict=True,
+            )
+        }
 
         # Create format support matrix
         for framework, analysis in framework_analysis.items():
@@ -363,10 +460,7 @@ class TableExtractionAnalyzer:
 
         # Save detailed JSON analysis
         json_file = output_dir / "table_extraction_analysis.json"
-        with open(json_file, "w") as f:
-            import json
-
-            json.dump(analysis, f, indent=2, default=str)
+        json_file.write_bytes(msgspec.json.format(msgspec.json.encode(analysis, enc_hook=str), indent=2))
 
         # Generate markdown report
         self._generate_markdown_report(analysis, output_dir / "table_extraction_report.md")
@@ -378,25 +472,23 @@ class TableExtractionAnalyzer:
 
     def _generate_markdown_report(self, analysis: dict[str, Any], output_file: Path) -> None:
         """Generate a markdown report for table extraction analysis."""
-        md_content = []
-        md_content.append("# Table Extraction Analysis Report\n")
+        md = io.StringIO()
+        md.write("# Table Extraction Analysis Report\n\n")
 
         # Summary section
         summary = analysis.get("summary", {})
-        md_content.append("## Executive Summary\n")
-        md_content.append(f"- **Total table files analyzed**: {analysis['total_table_files']}")
-        md_content.append(
-            f"- **Best framework for structure preservation**: {summary.get('best_framework_structure', 'N/A')}"
-        )
-        md_content.append(f"- **Best framework for table detection**: {summary.get('best_framework_detection', 'N/A')}")
-        md_content.append(f"- **Fastest framework**: {summary.get('best_framework_speed', 'N/A')}\n")
+        md.write("## Executive Summary\n\n")
+        md.write(f"- **Total table files analyzed**: {analysis['total_table_files']}\n")
+        md.write(f"- **Best framework for structure preservation**: {summary.get('best_framework_structure', 'N/A')}\n")
+        md.write(f"- **Best framework for table detection**: {summary.get('best_framework_detection', 'N/A')}\n")
+        md.write(f"- **Fastest framework**: {summary.get('best_framework_speed', 'N/A')}\n\n")
 
         # Framework rankings
         rankings = summary.get("framework_rankings", {})
         if rankings:
-            md_content.append("## Framework Rankings\n")
-            md_content.append("| Framework | Structure Score | Detection Score | Avg Speed (s) | Overall Ranking |")
-            md_content.append("|-----------|----------------|-----------------|---------------|-----------------|")
+            md.write("## Framework Rankings\n\n")
+            md.write("| Framework | Structure Score | Detection Score | Avg Speed (s) | Overall Ranking |\n")
+            md.write("|-----------|----------------|-----------------|---------------|-----------------|\n")
 
             sorted_frameworks = sorted(rankings.items(), key=lambda x: x[1]["ranking_score"], reverse=True)
 
@@ -405,47 +497,41 @@ class TableExtractionAnalyzer:
                 detection = f"{scores['detection_score']:.3f}"
                 speed = f"{scores['speed']:.2f}" if scores["speed"] != float("inf") else "N/A"
                 ranking = f"{scores['ranking_score']:.3f}"
-                md_content.append(f"| {framework} | {structure} | {detection} | {speed} | {ranking} |")
-            md_content.append("")
+                md.write(f"| {framework} | {structure} | {detection} | {speed} | {ranking} |\n")
+            md.write("\n")
 
         # Format support matrix
         format_matrix = summary.get("format_support_matrix", {})
         if format_matrix:
-            md_content.append("## Format Support Matrix\n")
+            md.write("## Format Support Matrix\n\n")
 
             frameworks = set()
             for format_data in format_matrix.values():
                 frameworks.update(format_data.keys())
             frameworks = sorted(frameworks)
 
-            header = "| Format |" + "".join(f" {fw} |" for fw in frameworks)
-            separator = "|--------|" + "".join("------|" for _ in frameworks)
-            md_content.append(header)
-            md_content.append(separator)
+            md.write("| Format |" + "".join(f" {fw} |" for fw in frameworks) + "\n")
+            md.write("|--------|" + "------|" * len(frameworks) + "\n")
 
             for file_format, framework_data in sorted(format_matrix.items()):
-                row = f"| {file_format} |"
-                for framework in frameworks:
-                    if framework in framework_data:
-                        success_rate = framework_data[framework]["success_rate"]
-                        row += f" {success_rate:.1%} |"
-                    else:
-                        row += " N/A |"
-                md_content.append(row)
-            md_content.append("")
+                cells = (
+                    f" {framework_data[framework]['success_rate']:.1%} |" if framework in framework_data else " N/A |"
+                    for framework in frameworks
+                )
+                md.write(f"| {file_format} |" + "".join(cells) + "\n")
+            md.write("\n")
 
         # File-specific analysis
-        md_content.append("## File-Specific Analysis\n")
+        md.write("## File-Specific Analysis\n")
         for file_path, file_analysis in analysis.get("file_analysis", {}).items():
             file_name = Path(file_path).name
-            md_content.append(f"### {file_name}")
-            md_content.append(f"- **File type**: {file_analysis['file_type']}")
-            md_content.append(f"- **Table complexity**: {file_analysis['table_complexity']}")
-            md_content.append(f"- **Best extraction**: {file_analysis.get('best_extraction', 'N/A')}\n")
+            md.write(f"\n### {file_name}\n")
+            md.write(f"- **File type**: {file_analysis['file_type']}\n")
+            md.write(f"- **Table complexity**: {file_analysis['table_complexity']}\n")
+            md.write(f"- **Best extraction**: {file_analysis.get('best_extraction', 'N/A')}\n")
 
         # Write the report
-        with open(output_file, "w") as f:
-            f.write("\n".join(md_content))
+        output_file.write_text(md.getvalue())
 
     def _generate_csv_summary(self, analysis: dict[str, Any], output_file: Path) -> None:
         """Generate a CSV summary of table extraction performance."""
@@ -477,12 +563,35 @@ class TableExtractionAnalyzer:
             df.to_csv(output_file, index=False)
 
 
+class _ResultFilePath(msgspec.Struct):
+    """File path of a serialized benchmark result; all other fields are skipped while decoding."""
+
+    file_path: str
+
+
 def analyze_table_extraction_from_results(results_file: Path, output_dir: Path) -> None:
     """Analyze table extraction from benchmark results file."""
-    # Load results
-    with open(results_file, "rb") as f:
-        results = msgspec.json.decode(f.read(), type=list[BenchmarkResult])
+    # Load results. Entries are first split without being parsed, then only their file path is
+    # decoded; full results are materialized for table files only, and each one is scored and
+    # its extracted text released as the analyzer consumes it.
+    results_bytes = results_file.read_bytes()
+    raw_results = msgspec.json.decode(results_bytes, type=list[msgspec.Raw])
+    path_decoder = msgspec.json.Decoder(_ResultFilePath)
+    result_decoder = msgspec.json.Decoder(BenchmarkResult)
+
+    is_table_file: dict[str, bool] = {}
+
+    def table_results() -> Iterator[BenchmarkResult]:
+        for raw_result in raw_results:
+            file_path = path_decoder.decode(raw_result).file_path
+            if file_path not in is_table_file:
+                is_table_file[file_path] = bool(_TABLE_KEYWORD_RE.search(Path(file_path).name.lower()))
+            if is_table_file[file_path]:
+                yield result_decoder.decode(raw_result)
 
     # Run table analysis
-    analyzer = TableExtractionAnalyzer(results)
+    analyzer = TableExtractionAnalyzer(table_results(), release_text=True)
+    # The raw entries are slices of the file contents; free both before the report is built
+    raw_results.clear()
+    del results_bytes
     analyzer.generate_table_analysis_report(output_dir)
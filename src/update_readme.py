@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-import json
+import re
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+import msgspec
+
+_RESULTS_HEADING = "## 📊 Latest Benchmark Results"
+_MAIN_HEADING_RE = re.compile(r"^#(?!#)", re.MULTILINE)
+
 
 def update_readme_with_results(
     readme_path: Path,
@@ -17,21 +22,22 @@ def update_readme_with_results(
     """Update README.md with latest benchmark results."""
     # Read current README
     if readme_path.exists():
-        with open(readme_path) as f:
-            content = f.read()
+        content = readme_path.read_text(encoding="utf-8")
     else:
         content = "# Python Text Extraction Libraries Benchmarks\n\n"
 
     # Generate timestamp
     timestamp = datetime.fromtimestamp(summary_metrics["timestamp"], tz=UTC).strftime("%Y-%m-%d %H:%M:%S UTC")
 
+    run_id_line = f"*Run ID: {run_id}*\n" if run_id else ""
+
     # Create benchmark results section
-    results_section = f"""
+    parts = [
+        f"""
 ## 📊 Latest Benchmark Results
 
 *Last updated: {timestamp}*
-{f"*Run ID: {run_id}*" if run_id else ""}
-
+{run_id_line}
 ### Summary
 
 - **Total Files Processed:** {summary_metrics["total_files"]:,}
@@ -45,14 +51,17 @@ def update_readme_with_results(
 | Framework | Success Rate | Avg Time | Total Files | Status |
 |-----------|--------------|----------|-------------|---------|
 """
+    ]
 
     # Add framework stats
     for framework, stats in summary_metrics["framework_stats"].items():
         status = "🟢" if stats["success_rate"] > 90 else "🟡" if stats["success_rate"] > 70 else "🔴"
-        results_section += f"| {framework} | {stats['success_rate']:.1f}% | {stats['avg_time']:.2f}s | {stats['total_files']} | {status} |\n"
+        parts.append(
+            f"| {framework} | {stats['success_rate']:.1f}% | {stats['avg_time']:.2f}s | {stats['total_files']} | {status} |\n"
+        )
 
     # Add visualizations section
-    results_section += """
+    parts.append("""
 ### Visualizations
 
 📊 **[Interactive Dashboard](visualizations/interactive_dashboard.html)** - Comprehensive interactive analysis
@@ -76,39 +85,28 @@ For detailed analysis, download the comprehensive reports:
 - 🌐 [HTML Report](reports/benchmark_report.html)
 
 ---
-"""
-
-    # Find existing results section and replace it
-    start_marker = "## 📊 Latest Benchmark Results"
-    end_marker = "---\n"
-
-    start_idx = content.find(start_marker)
-    if start_idx != -1:
-        # Find the end of the results section
-        temp_content = content[start_idx:]
-        end_idx = temp_content.find(end_marker)
-        if end_idx != -1:
-            end_idx += len(end_marker)
-            # Replace the existing section
-            content = content[:start_idx] + results_section + content[start_idx + end_idx :]
-        else:
-            # No end marker found, replace everything after start marker
-            content = content[:start_idx] + results_section
+""")
+    results_section = "".join(parts)
+
+    # Replace the existing results section, up to and including its closing "---" line, or
+    # everything after its heading when the closing marker is missing
+    before, heading, rest = content.partition(_RESULTS_HEADING)
+    if heading:
+        _, _, tail = rest.partition("---\n")
+        content = f"{before}{results_section}{tail}"
     else:
-        # No existing results section, add after main heading
-        lines = content.split("\n")
-        insert_idx = 1  # After main heading
-        for i, line in enumerate(lines):
-            if line.startswith("#") and not line.startswith("##"):
-                insert_idx = i + 1
-                break
-
-        lines.insert(insert_idx, results_section)
-        content = "\n".join(lines)
+        # No existing results section, add after main heading (or after the first line)
+        main_heading = _MAIN_HEADING_RE.search(content)
+        line_end = content.find("\n", main_heading.start() if main_heading else 0)
+        if line_end == -1:
+            content = f"{content}\n{results_section}"
+        else:
+            content = f"{content[:line_end]}\n{results_section}{content[line_end:]}"
 
-    # Write updated README
-    with open(readme_path, "w") as f:
-        f.write(content)
+    # Write updated README through a temporary file, so readers never see a partially written README
+    tmp_path = readme_path.with_name(f"{readme_path.name}.tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    tmp_path.replace(readme_path)
 
 
 def main() -> None:
@@ -130,8 +128,8 @@ def main() -> None:
     def update_readme(summary_file: str, readme_path: str, visualizations_dir: str, run_id: str | None) -> None:
         """Update README with benchmark results."""
         # Load summary metrics
-        with open(summary_file) as f:
-            summary_metrics = json.load(f)
+        with open(summary_file, "rb") as f:
+            summary_metrics = msgspec.json.decode(f.read())
 
         # Update README
         update_readme_with_results(Path(readme_path), summary_metrics, Path(visualizations_dir), run_id)
@@ -1,18 +1,29 @@
 """Visualization module for benchmark results."""
-# ruff: noqa: PERF401, PLR0915
 
 from __future__ import annotations
 
+import mmap
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
 
-import matplotlib.pyplot as plt
 import msgspec
+import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
-import seaborn as sns
-from plotly.subplots import make_subplots
 
-from src.types import AggregatedResults
+from src.types import AggregatedResults, BenchmarkSummary
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from types import ModuleType
+
+    from matplotlib.figure import Figure
+    from plotly.basedatatypes import BaseTraceType
 
 # Consistent color scheme for frameworks
 FRAMEWORK_COLORS = {
@@ -28,102 +39,278 @@ FRAMEWORK_COLORS = {
     "unstructured": "#5B9A8B",  # Green
     "extractous": "#FF6B35",  # Orange-red (Rust color theme)
 }
+# Color for frameworks without an entry in FRAMEWORK_COLORS
+DEFAULT_FRAMEWORK_COLOR = "#999999"
+
+# Resolution of the PNG charts, enough for the README and GitHub Pages embeds
+DEFAULT_DPI = 150
+
+# Numeric columns of the flattened summary frame: column -> (BenchmarkSummary attribute, dtype)
+SUMMARY_SCHEMA = {
+    "avg_time": ("avg_extraction_time", np.float64),
+    "median_time": ("median_extraction_time", np.float64),
+    "files_per_second": ("files_per_second", np.float64),
+    "mb_per_second": ("mb_per_second", np.float64),
+    "peak_memory_mb": ("avg_peak_memory_mb", np.float64),
+    "cpu_percent": ("avg_cpu_percent", np.float64),
+    "success_rate": ("success_rate", np.float64),
+    "total_files": ("total_files", np.int64),
+    "successful_files": ("successful_files", np.int64),
+    "failed_files": ("failed_files", np.int64),
+    "timeout_files": ("timeout_files", np.int64),
+}
+
+
+def _enum_value(value: object) -> str:
+    return str(value.value) if hasattr(value, "value") else str(value)
+
+
+def _framework_colors(frameworks: Iterable[str]) -> list[str]:
+    """Look up the chart color of each framework."""
+    return [FRAMEWORK_COLORS.get(fw, DEFAULT_FRAMEWORK_COLOR) for fw in frameworks]
+
+
+@lru_cache(maxsize=1)
+def _pyplot() -> ModuleType:
+    """Import pyplot on the non-interactive Agg backend on first use.
+
+    The plotting libraries are only imported once a chart is drawn, so summary metrics skip their import cost.
+    """
+    import matplotlib as mpl
+
+    # Charts are only ever written to files, so render without an interactive GUI backend
+    mpl.use("Agg")
+
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+@contextmanager
+def _new_figure(figsize: tuple[float, float]) -> Iterator[Figure]:
+    """Create a pyplot figure that is closed when the block exits, even if drawing the chart fails."""
+    plt = _pyplot()
+    fig = plt.figure(figsize=figsize)
+    try:
+        yield fig
+    finally:
+        plt.close(fig)
+
+
+def _init_chart_style(dpi: int) -> None:
+    """Set up the matplotlib/seaborn style shared by every chart, in this process or a chart worker."""
+    import seaborn as sns
+
+    plt = _pyplot()
+
+    # Set style for matplotlib/seaborn with larger default sizes
+    plt.style.use("default")
+    plt.rcParams.update(
+        {
+            "figure.dpi": dpi,
+            "savefig.dpi": dpi,
+            "font.size": 12,
+            "axes.titlesize": 16,
+            "axes.labelsize": 14,
+            "xtick.labelsize": 12,
+            "ytick.labelsize": 12,
+            "legend.fontsize": 12,
+        }
+    )
+
+    # Set consistent color palette for frameworks
+    framework_colors = list(FRAMEWORK_COLORS.values())
+    sns.set_palette(framework_colors)
 
 
 class BenchmarkVisualizer:
     """Generate comprehensive visualizations from benchmark results."""
 
-    def __init__(self, output_dir: Path = Path("results/charts")) -> None:
+    # Typed decoders shared by every load, decoding straight into the result structs
+    _DECODER: ClassVar[msgspec.json.Decoder[AggregatedResults]] = msgspec.json.Decoder(AggregatedResults)
+    _MSGPACK_DECODER: ClassVar[msgspec.msgpack.Decoder[AggregatedResults]] = msgspec.msgpack.Decoder(AggregatedResults)
+    _MSGPACK_SUFFIXES: ClassVar[frozenset[str]] = frozenset({".msgpack", ".mpk"})
+    # Smaller files are read into memory, where mapping them costs more than the copy it saves
+    _MMAP_MIN_SIZE: ClassVar[int] = 1 << 20
+    # Smaller summaries are charted inline, as starting the chart workers takes longer than rendering every chart
+    _PARALLEL_CHART_MIN_ROWS: ClassVar[int] = 100
+
+    def __init__(self, output_dir: Path = Path("results/charts"), *, dpi: int = DEFAULT_DPI) -> None:
         self.output_dir = output_dir
+        self.dpi = dpi
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Last decoded aggregated file, keyed by (path, mtime_ns, size), shared by all entry points
+        self._aggregated_cache: dict[tuple[Path, int, int], AggregatedResults] = {}
+        # Summary frame of the last aggregated results it was built from
+        self._summary_frame_cache: tuple[AggregatedResults, pd.DataFrame] | None = None
 
-        # Set style for matplotlib/seaborn with larger default sizes
-        plt.style.use("default")
-        plt.rcParams.update(
-            {
-                "figure.dpi": 150,
-                "savefig.dpi": 150,
-                "font.size": 12,
-                "axes.titlesize": 16,
-                "axes.labelsize": 14,
-                "xtick.labelsize": 12,
-                "ytick.labelsize": 12,
-                "legend.fontsize": 12,
-            }
-        )
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle only the output settings for chart workers, not the decoded results caches."""
+        return {**self.__dict__, "_aggregated_cache": {}, "_summary_frame_cache": None}
 
-        # Set consistent color palette for frameworks
-        framework_colors = list(FRAMEWORK_COLORS.values())
-        sns.set_palette(framework_colors)
+    def generate_all_visualizations(self, aggregated_file: Path, *, use_cache: bool = False) -> list[Path]:
+        """Generate all visualizations from aggregated results.
+
+        With use_cache, the generated files are listed in a manifest in the output directory and reused as long as
+        the manifest is newer than the aggregated file and every listed file still exists.
+        """
+        manifest_path = self.output_dir / "visualizations.msgpack"
+        if use_cache and (cached := self._cached_visualizations(aggregated_file, manifest_path)) is not None:
+            return cached
 
-    def generate_all_visualizations(self, aggregated_file: Path) -> list[Path]:
-        """Generate all visualizations from aggregated results."""
         # Load data
-        with open(aggregated_file, "rb") as f:
-            aggregated = msgspec.json.decode(f.read(), type=AggregatedResults)
+        aggregated = self._load_aggregated(aggregated_file)
+        df = self._build_summary_frame(aggregated)
+
+        # Nothing to chart without framework summaries
+        if df.empty:
+            return []
 
         output_files = []
 
         # Generate individual visualizations
-        output_files.extend(self._create_performance_comparison(aggregated))
-        output_files.extend(self._create_memory_usage_charts(aggregated))
-        output_files.extend(self._create_success_rate_chart(aggregated))
-        output_files.extend(self._create_throughput_charts(aggregated))
+        performance, memory, success_rate, throughput, category = self._render_charts(
+            df,
+            [
+                self._create_performance_comparison,
+                self._create_memory_usage_charts,
+                self._create_success_rate_chart,
+                self._create_throughput_charts,
+                self._create_category_analysis,
+            ],
+        )
+        output_files.extend(performance)
+        output_files.extend(memory)
+        output_files.extend(success_rate)
+        output_files.extend(throughput)
         output_files.extend(self._create_per_file_breakdown(aggregated))
-        output_files.extend(self._create_category_analysis(aggregated))
-        output_files.append(self._create_interactive_dashboard(aggregated))
+        output_files.extend(category)
+        output_files.append(self._create_interactive_dashboard(df))
+
+        if use_cache:
+            manifest = {
+                "source": str(aggregated_file.resolve()),
+                "dpi": self.dpi,
+                "files": [path.name for path in output_files],
+            }
+            manifest_path.write_bytes(msgspec.msgpack.encode(manifest))
 
         return output_files
 
-    def _create_performance_comparison(self, aggregated: AggregatedResults) -> list[Path]:
-        """Create performance comparison charts."""
-        output_files = []
+    def _cached_visualizations(self, aggregated_file: Path, manifest_path: Path) -> list[Path] | None:
+        """Return the files of a still valid visualization manifest, or None if the charts must be rendered."""
+        if not manifest_path.exists() or manifest_path.stat().st_mtime < aggregated_file.stat().st_mtime:
+            return None
+
+        manifest = msgspec.msgpack.decode(manifest_path.read_bytes())
+        if manifest["source"] != str(aggregated_file.resolve()) or manifest["dpi"] != self.dpi:
+            return None
+
+        output_files = [self.output_dir / name for name in manifest["files"]]
+        return output_files if all(path.exists() for path in output_files) else None
+
+    def _render_charts(
+        self, summary_df: pd.DataFrame, chart_jobs: list[Callable[[pd.DataFrame], list[Path]]]
+    ) -> list[list[Path]]:
+        """Run the matplotlib chart jobs, in parallel worker processes for large summaries on multi-CPU machines."""
+        max_workers = min(len(chart_jobs), os.cpu_count() or 1)
+        if max_workers == 1 or len(summary_df) < self._PARALLEL_CHART_MIN_ROWS:
+            _init_chart_style(self.dpi)
+            return [job(summary_df) for job in chart_jobs]
+
+        # The charts are independent and CPU-bound in rendering and PNG encoding
+        mp_context = multiprocessing.get_context("forkserver" if sys.platform == "linux" else "spawn")
+        if sys.platform == "linux":
+            # Import the plotting stack once in the fork server rather than in every worker
+            mp_context.set_forkserver_preload([__name__, "matplotlib.pyplot", "seaborn"])
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=mp_context, initializer=_init_chart_style, initargs=(self.dpi,)
+        ) as executor:
+            futures = [executor.submit(job, summary_df) for job in chart_jobs]
+            return [future.result() for future in futures]
+
+    def _load_aggregated(self, aggregated_file: Path) -> AggregatedResults:
+        """Decode aggregated results, memory-mapping large files rather than copying them into a bytes object.
+
+        Files with a .msgpack or .mpk suffix are decoded as msgpack, anything else as JSON. The last decoded
+        file is reused until it changes on disk.
+        """
+        key = self._source_key(aggregated_file)
+        if (aggregated := self._aggregated_cache.get(key)) is None:
+            decoder = self._MSGPACK_DECODER if aggregated_file.suffix in self._MSGPACK_SUFFIXES else self._DECODER
+            if key[2] < self._MMAP_MIN_SIZE:
+                aggregated = decoder.decode(aggregated_file.read_bytes())
+            else:
+                with open(aggregated_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    aggregated = decoder.decode(buffer)
+            self._aggregated_cache = {key: aggregated}
+        return aggregated
+
+    @staticmethod
+    def _source_key(aggregated_file: Path) -> tuple[Path, int, int]:
+        """Identify a version of an aggregated file by its resolved path, mtime_ns and size."""
+        stat = aggregated_file.stat()
+        return aggregated_file.resolve(), stat.st_mtime_ns, stat.st_size
+
+    def _build_summary_frame(self, aggregated: AggregatedResults) -> pd.DataFrame:
+        """Flatten all framework summaries once into a frame shared by every chart.
+
+        Missing measurements become NaN so each chart can filter its own rows. The frame is reused for as
+        long as the same decoded results are passed in.
+        """
+        if self._summary_frame_cache is not None and self._summary_frame_cache[0] is aggregated:
+            return self._summary_frame_cache[1]
+
+        summaries = [summary for fw_summaries in aggregated.framework_summaries.values() for summary in fw_summaries]
+
+        # Build each column directly with its declared dtype; None converts to NaN in the float columns
+        columns: dict[str, Any] = {
+            "framework": pd.Categorical([_enum_value(summary.framework) for summary in summaries]),
+            "category": pd.Categorical([_enum_value(summary.category) for summary in summaries]),
+        }
+        for column, (attribute, dtype) in SUMMARY_SCHEMA.items():
+            columns[column] = np.array([getattr(summary, attribute) for summary in summaries], dtype=dtype)
 
-        # Extract data for visualization - flatten framework summaries
-        all_summaries = []
-        for fw_summaries in aggregated.framework_summaries.values():
-            all_summaries.extend(fw_summaries)
+        summary_df = pd.DataFrame(columns)
+        self._summary_frame_cache = (aggregated, summary_df)
+        return summary_df
 
-        perf_data = []
-        for summary in all_summaries:
-            if summary.total_files > 0:
-                perf_data.append(
-                    {
-                        "Framework": str(summary.framework.value)
-                        if hasattr(summary.framework, "value")
-                        else str(summary.framework),
-                        "Category": str(summary.category.value)
-                        if hasattr(summary.category, "value")
-                        else str(summary.category),
-                        "Avg Time (s)": summary.avg_extraction_time,
-                        "Median Time (s)": summary.median_extraction_time,
-                        "Files per Second": summary.files_per_second,
-                        "Success Rate (%)": (summary.success_rate * 100) if summary.success_rate is not None else 0,
-                    }
-                )
+    def _create_performance_comparison(self, summary_df: pd.DataFrame) -> list[Path]:
+        """Create performance comparison charts."""
+        plt = _pyplot()
+        output_files = []
 
-        if not perf_data:
+        perf = summary_df[summary_df["total_files"] > 0]
+        if perf.empty:
             return output_files
 
-        df = pd.DataFrame(perf_data)
+        df = pd.DataFrame(
+            {
+                "Framework": perf["framework"],
+                "Category": perf["category"],
+                "Avg Time (s)": perf["avg_time"],
+                "Median Time (s)": perf["median_time"],
+                "Files per Second": perf["files_per_second"],
+                "Success Rate (%)": perf["success_rate"].fillna(0) * 100,
+            }
+        )
 
         # 1. Large performance comparison by category
-        fig = plt.figure(figsize=(20, 12))
-        df_pivot = df.pivot(index="Framework", columns="Category", values="Avg Time (s)")
-
-        ax = df_pivot.plot(kind="bar", width=0.8, figsize=(20, 12))
-        plt.title("Average Extraction Time by Framework and Category", fontsize=20, fontweight="bold", pad=20)
-        plt.xlabel("Framework", fontsize=16)
-        plt.ylabel("Average Time (seconds)", fontsize=16)
-        plt.yscale("log")
-        plt.grid(True, alpha=0.3, axis="y")
-        plt.legend(title="Category", bbox_to_anchor=(1.05, 1), loc="upper left", fontsize=14)
-        plt.xticks(rotation=45, ha="right")
-        plt.tight_layout()
-
-        output_path = self.output_dir / "performance_comparison_large.png"
-        plt.savefig(output_path, bbox_inches="tight", dpi=150)
-        plt.close()
+        with _new_figure((20, 12)) as fig:
+            ax = fig.subplots()
+            df_pivot = df.pivot(index="Framework", columns="Category", values="Avg Time (s)")
+            df_pivot.plot(kind="bar", width=0.8, ax=ax)
+            plt.title("Average Extraction Time by Framework and Category", fontsize=20, fontweight="bold", pad=20)
+            plt.xlabel("Framework", fontsize=16)
+            plt.ylabel("Average Time (seconds)", fontsize=16)
+            plt.yscale("log")
+            plt.grid(True, alpha=0.3, axis="y")
+            plt.legend(title="Category", bbox_to_anchor=(1.05, 1), loc="upper left", fontsize=14)
+            plt.xticks(rotation=45, ha="right")
+            plt.tight_layout()
+
+            output_path = self.output_dir / "performance_comparison_large.png"
+            plt.savefig(output_path, bbox_inches="tight", dpi=self.dpi)
         output_files.append(output_path)
 
         # 2. Performance by size category (focused view)
@@ -131,290 +318,219 @@ class BenchmarkVisualizer:
         df_sizes = df[df["Category"].isin(size_categories)]
 
         if not df_sizes.empty:
-            fig, axes = plt.subplots(2, 3, figsize=(24, 16))
-            axes = axes.flatten()
-
-            for idx, category in enumerate(size_categories):
-                ax = axes[idx]
-                cat_data = df_sizes[df_sizes["Category"] == category].sort_values("Avg Time (s)")
-
-                if not cat_data.empty:
-                    bars = ax.bar(
-                        cat_data["Framework"],
-                        cat_data["Avg Time (s)"],
-                        color=[FRAMEWORK_COLORS.get(fw, "#999999") for fw in cat_data["Framework"]],
-                    )
-                    ax.set_title(f"{category.title()} Files", fontsize=16, fontweight="bold")
-                    ax.set_ylabel("Average Time (s)", fontsize=14)
-                    ax.set_yscale("log")
-                    ax.grid(True, alpha=0.3, axis="y")
-                    ax.tick_params(axis="x", rotation=45)
-
-                    # Add value labels on bars
-                    for bar, val in zip(bars, cat_data["Avg Time (s)"], strict=False):
-                        ax.text(
-                            bar.get_x() + bar.get_width() / 2,
-                            bar.get_height(),
-                            f"{val:.3f}s",
-                            ha="center",
-                            va="bottom",
-                            fontsize=10,
+            with _new_figure((24, 16)) as fig:
+                axes = fig.subplots(2, 3).flatten()
+
+                for idx, category in enumerate(size_categories):
+                    ax = axes[idx]
+                    cat_data = df_sizes[df_sizes["Category"] == category].sort_values("Avg Time (s)")
+
+                    if not cat_data.empty:
+                        bars = ax.bar(
+                            cat_data["Framework"],
+                            cat_data["Avg Time (s)"],
+                            color=_framework_colors(cat_data["Framework"]),
                         )
+                        ax.set_title(f"{category.title()} Files", fontsize=16, fontweight="bold")
+                        ax.set_ylabel("Average Time (s)", fontsize=14)
+                        ax.set_yscale("log")
+                        ax.grid(True, alpha=0.3, axis="y")
+                        ax.tick_params(axis="x", rotation=45)
 
-            # Hide the 6th subplot
-            axes[5].axis("off")
+                        # Add value labels on bars
+                        ax.bar_label(bars, fmt="{:.3f}s", fontsize=10)
 
-            plt.suptitle("Performance Comparison by File Size Category", fontsize=20, fontweight="bold")
-            plt.tight_layout()
+                # Hide the 6th subplot
+                axes[5].axis("off")
+
+                plt.suptitle("Performance Comparison by File Size Category", fontsize=20, fontweight="bold")
+                plt.tight_layout()
 
-            output_path = self.output_dir / "performance_by_size_category.png"
-            plt.savefig(output_path, bbox_inches="tight", dpi=150)
-            plt.close()
+                output_path = self.output_dir / "performance_by_size_category.png"
+                plt.savefig(output_path, bbox_inches="tight", dpi=self.dpi)
             output_files.append(output_path)
 
         return output_files
 
-    def _create_memory_usage_charts(self, aggregated: AggregatedResults) -> list[Path]:
+    def _create_memory_usage_charts(self, summary_df: pd.DataFrame) -> list[Path]:
         """Create memory usage visualizations."""
+        import seaborn as sns
+
+        plt = _pyplot()
         output_files = []
 
         # Extract memory data
-        memory_data = []
-        # Flatten framework summaries
-        all_summaries = []
-        for fw_summaries in aggregated.framework_summaries.values():
-            all_summaries.extend(fw_summaries)
-
-        for summary in all_summaries:
-            if summary.avg_peak_memory_mb and summary.avg_peak_memory_mb > 0:
-                memory_data.append(
-                    {
-                        "Framework": str(summary.framework.value)
-                        if hasattr(summary.framework, "value")
-                        else str(summary.framework),
-                        "Category": str(summary.category.value)
-                        if hasattr(summary.category, "value")
-                        else str(summary.category),
-                        "Avg Memory (MB)": summary.avg_peak_memory_mb,
-                        "CPU Usage (%)": summary.avg_cpu_percent,
-                    }
-                )
-
-        if not memory_data:
+        memory = summary_df[summary_df["peak_memory_mb"] > 0]
+        if memory.empty:
             return output_files
 
-        df = pd.DataFrame(memory_data)
+        df = pd.DataFrame(
+            {
+                "Framework": memory["framework"],
+                "Category": memory["category"],
+                "Avg Memory (MB)": memory["peak_memory_mb"],
+                "CPU Usage (%)": memory["cpu_percent"],
+            }
+        )
 
         # Create large dual-axis chart
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(20, 16))
-
-        # Memory usage heatmap
-        df_pivot = df.pivot(index="Framework", columns="Category", values="Avg Memory (MB)")
-        sns.heatmap(df_pivot, annot=True, fmt=".0f", cmap="YlOrRd", ax=ax1, cbar_kws={"label": "Memory Usage (MB)"})
-        ax1.set_title("Average Peak Memory Usage by Framework and Category", fontsize=18, fontweight="bold", pad=15)
-        ax1.set_xlabel("")
-
-        # CPU usage heatmap
-        df_pivot_cpu = df.pivot(index="Framework", columns="Category", values="CPU Usage (%)")
-        sns.heatmap(df_pivot_cpu, annot=True, fmt=".1f", cmap="Blues", ax=ax2, cbar_kws={"label": "CPU Usage (%)"})
-        ax2.set_title("Average CPU Usage by Framework and Category", fontsize=18, fontweight="bold", pad=15)
-
-        plt.tight_layout()
-        output_path = self.output_dir / "resource_usage_heatmaps.png"
-        plt.savefig(output_path, bbox_inches="tight", dpi=150)
-        plt.close()
+        with _new_figure((20, 16)) as fig:
+            ax1, ax2 = fig.subplots(2, 1)
+
+            # Pivot both measurements at once; each heatmap takes its own column block
+            df_pivot_all = df.pivot(index="Framework", columns="Category", values=["Avg Memory (MB)", "CPU Usage (%)"])
+
+            # Memory usage heatmap
+            df_pivot = df_pivot_all["Avg Memory (MB)"]
+            sns.heatmap(df_pivot, annot=True, fmt=".0f", cmap="YlOrRd", ax=ax1, cbar_kws={"label": "Memory Usage (MB)"})
+            ax1.set_title("Average Peak Memory Usage by Framework and Category", fontsize=18, fontweight="bold", pad=15)
+            ax1.set_xlabel("")
+
+            # CPU usage heatmap
+            df_pivot_cpu = df_pivot_all["CPU Usage (%)"]
+            sns.heatmap(df_pivot_cpu, annot=True, fmt=".1f", cmap="Blues", ax=ax2, cbar_kws={"label": "CPU Usage (%)"})
+            ax2.set_title("Average CPU Usage by Framework and Category", fontsize=18, fontweight="bold", pad=15)
+
+            plt.tight_layout()
+            output_path = self.output_dir / "resource_usage_heatmaps.png"
+            plt.savefig(output_path, bbox_inches="tight", dpi=self.dpi)
         output_files.append(output_path)
 
         return output_files
 
-    def _create_success_rate_chart(self, aggregated: AggregatedResults) -> list[Path]:
+    def _create_success_rate_chart(self, summary_df: pd.DataFrame) -> list[Path]:
         """Create success rate visualization."""
+        plt = _pyplot()
         output_files = []
 
-        # Calculate overall success rates
-        framework_stats = {}
-        # Flatten framework summaries
-        all_summaries = []
-        for fw_summaries in aggregated.framework_summaries.values():
-            all_summaries.extend(fw_summaries)
-
-        for summary in all_summaries:
-            framework_key = summary.framework.value if hasattr(summary.framework, "value") else str(summary.framework)
-            if framework_key not in framework_stats:
-                framework_stats[framework_key] = {
-                    "total": 0,
-                    "successful": 0,
-                    "failed": 0,
-                    "timeout": 0,
-                }
+        if summary_df.empty:
+            return output_files
 
-            stats = framework_stats[framework_key]
-            stats["total"] += summary.total_files
-            stats["successful"] += summary.successful_files
-            stats["failed"] += summary.failed_files
-            stats["timeout"] += summary.timeout_files
+        # Calculate overall success rates
+        framework_stats = summary_df.groupby("framework", sort=False, observed=True)[
+            ["total_files", "successful_files", "failed_files", "timeout_files"]
+        ].sum()
 
         # Create detailed success chart
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(20, 10))
-
-        # Overall success rates
-        frameworks = list(framework_stats.keys())
-        success_rates = [
-            (stats["successful"] / stats["total"] * 100) if stats["total"] > 0 else 0
-            for stats in framework_stats.values()
-        ]
-
-        bars = ax1.bar(frameworks, success_rates, color=[FRAMEWORK_COLORS.get(fw, "#999999") for fw in frameworks])
-        ax1.set_title("Overall Success Rate by Framework", fontsize=18, fontweight="bold")
-        ax1.set_ylabel("Success Rate (%)", fontsize=14)
-        ax1.set_ylim(0, 105)
-        ax1.grid(True, alpha=0.3, axis="y")
-
-        # Add value labels
-        for bar, rate in zip(bars, success_rates, strict=False):
-            ax1.text(
-                bar.get_x() + bar.get_width() / 2,
-                bar.get_height() + 1,
-                f"{rate:.1f}%",
-                ha="center",
-                va="bottom",
-                fontsize=12,
-            )
-
-        ax1.tick_params(axis="x", rotation=45)
-
-        # Failure breakdown
-        failure_data = []
-        for fw, stats in framework_stats.items():
-            if stats["failed"] > 0 or stats["timeout"] > 0:
-                failure_data.append(
-                    {
-                        "Framework": fw,
-                        "Failed": stats["failed"],
-                        "Timeout": stats["timeout"],
-                    }
+        with _new_figure((20, 10)) as fig:
+            ax1, ax2 = fig.subplots(1, 2)
+
+            # Overall success rates
+            frameworks = framework_stats.index.tolist()
+            total_files = framework_stats["total_files"]
+            success_rates = (framework_stats["successful_files"] / total_files * 100).where(total_files > 0, 0)
+
+            bars = ax1.bar(frameworks, success_rates.to_numpy(), color=_framework_colors(frameworks))
+            ax1.set_title("Overall Success Rate by Framework", fontsize=18, fontweight="bold")
+            ax1.set_ylabel("Success Rate (%)", fontsize=14)
+            ax1.set_ylim(0, 105)
+            ax1.grid(True, alpha=0.3, axis="y")
+
+            # Add value labels
+            ax1.bar_label(bars, fmt="{:.1f}%", padding=3, fontsize=12)
+
+            ax1.tick_params(axis="x", rotation=45)
+
+            # Failure breakdown
+            failures = framework_stats[(framework_stats["failed_files"] > 0) | (framework_stats["timeout_files"] > 0)]
+
+            if not failures.empty:
+                df_failures = pd.DataFrame(
+                    {"Failed": failures["failed_files"], "Timeout": failures["timeout_files"]}
+                ).rename_axis("Framework")
+                df_failures.plot(kind="bar", stacked=True, ax=ax2, color=["#ef4444", "#f59e0b"])
+                ax2.set_title("Failure Breakdown by Type", fontsize=18, fontweight="bold")
+                ax2.set_ylabel("Number of Files", fontsize=14)
+                ax2.tick_params(axis="x", rotation=45)
+                ax2.legend(title="Failure Type")
+            else:
+                ax2.text(
+                    0.5,
+                    0.5,
+                    "No failures detected!",
+                    transform=ax2.transAxes,
+                    ha="center",
+                    va="center",
+                    fontsize=20,
+                    fontweight="bold",
+                    color="green",
                 )
+                ax2.set_xticks([])
+                ax2.set_yticks([])
 
-        if failure_data:
-            df_failures = pd.DataFrame(failure_data)
-            df_failures.set_index("Framework")[["Failed", "Timeout"]].plot(
-                kind="bar", stacked=True, ax=ax2, color=["#ef4444", "#f59e0b"]
-            )
-            ax2.set_title("Failure Breakdown by Type", fontsize=18, fontweight="bold")
-            ax2.set_ylabel("Number of Files", fontsize=14)
-            ax2.tick_params(axis="x", rotation=45)
-            ax2.legend(title="Failure Type")
-        else:
-            ax2.text(
-                0.5,
-                0.5,
-                "No failures detected!",
-                transform=ax2.transAxes,
-                ha="center",
-                va="center",
-                fontsize=20,
-                fontweight="bold",
-                color="green",
-            )
-            ax2.set_xticks([])
-            ax2.set_yticks([])
-
-        plt.tight_layout()
-        output_path = self.output_dir / "success_and_failure_analysis.png"
-        plt.savefig(output_path, bbox_inches="tight", dpi=150)
-        plt.close()
+            plt.tight_layout()
+            output_path = self.output_dir / "success_and_failure_analysis.png"
+            plt.savefig(output_path, bbox_inches="tight", dpi=self.dpi)
         output_files.append(output_path)
 
         return output_files
 
-    def _create_throughput_charts(self, aggregated: AggregatedResults) -> list[Path]:
+    def _create_throughput_charts(self, summary_df: pd.DataFrame) -> list[Path]:
         """Create throughput visualizations."""
+        plt = _pyplot()
         output_files = []
 
-        throughput_data = []
-        # Flatten framework summaries
-        all_summaries = []
-        for fw_summaries in aggregated.framework_summaries.values():
-            all_summaries.extend(fw_summaries)
-
-        for summary in all_summaries:
-            if summary.mb_per_second and summary.mb_per_second > 0:
-                throughput_data.append(
-                    {
-                        "Framework": str(summary.framework.value)
-                        if hasattr(summary.framework, "value")
-                        else str(summary.framework),
-                        "Category": str(summary.category.value)
-                        if hasattr(summary.category, "value")
-                        else str(summary.category),
-                        "Files/Second": summary.files_per_second,
-                        "MB/Second": summary.mb_per_second,
-                    }
-                )
-
-        if not throughput_data:
+        throughput = summary_df[summary_df["mb_per_second"] > 0]
+        if throughput.empty:
             return output_files
 
-        df = pd.DataFrame(throughput_data)
+        df = pd.DataFrame(
+            {
+                "Framework": throughput["framework"],
+                "Category": throughput["category"],
+                "Files/Second": throughput["files_per_second"],
+                "MB/Second": throughput["mb_per_second"],
+            }
+        )
 
         # Create comprehensive throughput visualization
-        fig = plt.figure(figsize=(22, 14))
-
-        # Create subplot layout
-        gs = fig.add_gridspec(2, 2, height_ratios=[1, 1], width_ratios=[3, 2])
-        ax1 = fig.add_subplot(gs[0, :])
-        ax2 = fig.add_subplot(gs[1, 0])
-        ax3 = fig.add_subplot(gs[1, 1])
-
-        # Main throughput comparison
-        df_pivot = df.pivot(index="Framework", columns="Category", values="MB/Second")
-        df_pivot.plot(kind="bar", ax=ax1, width=0.8)
-        ax1.set_title("Data Throughput by Framework and Category", fontsize=18, fontweight="bold")
-        ax1.set_ylabel("Throughput (MB/s)", fontsize=14)
-        ax1.set_yscale("log")
-        ax1.grid(True, alpha=0.3, axis="y")
-        ax1.legend(title="Category", bbox_to_anchor=(1.05, 1), loc="upper left")
-        ax1.tick_params(axis="x", rotation=45)
-
-        # Files per second for size categories
-        size_cats = ["tiny", "small", "medium", "large", "huge"]
-        df_sizes = df[df["Category"].isin(size_cats)]
-        if not df_sizes.empty:
-            df_pivot_files = df_sizes.pivot(index="Framework", columns="Category", values="Files/Second")
-            df_pivot_files.plot(kind="bar", ax=ax2, width=0.8)
-            ax2.set_title("Files Processed per Second (Size Categories)", fontsize=16, fontweight="bold")
-            ax2.set_ylabel("Files/Second", fontsize=14)
-            ax2.set_yscale("log")
-            ax2.grid(True, alpha=0.3, axis="y")
-            ax2.tick_params(axis="x", rotation=45)
-            ax2.legend(title="Category")
-
-        # Average throughput summary
-        avg_throughput = df.groupby("Framework")["MB/Second"].mean().sort_values(ascending=False)
-        bars = ax3.barh(
-            avg_throughput.index,
-            avg_throughput.values,
-            color=[FRAMEWORK_COLORS.get(fw, "#999999") for fw in avg_throughput.index],
-        )
-        ax3.set_title("Average Throughput Across All Categories", fontsize=16, fontweight="bold")
-        ax3.set_xlabel("Average MB/Second", fontsize=14)
-        ax3.grid(True, alpha=0.3, axis="x")
-
-        # Add value labels
-        for bar, val in zip(bars, avg_throughput.values, strict=False):
-            ax3.text(
-                bar.get_width() + val * 0.01,
-                bar.get_y() + bar.get_height() / 2,
-                f"{val:.1f}",
-                ha="left",
-                va="center",
-                fontsize=11,
+        with _new_figure((22, 14)) as fig:
+            # Create subplot layout
+            gs = fig.add_gridspec(2, 2, height_ratios=[1, 1], width_ratios=[3, 2])
+            ax1 = fig.add_subplot(gs[0, :])
+            ax2 = fig.add_subplot(gs[1, 0])
+            ax3 = fig.add_subplot(gs[1, 1])
+
+            # Main throughput comparison
+            df_pivot = df.pivot(index="Framework", columns="Category", values="MB/Second")
+            df_pivot.plot(kind="bar", ax=ax1, width=0.8)
+            ax1.set_title("Data Throughput by Framework and Category", fontsize=18, fontweight="bold")
+            ax1.set_ylabel("Throughput (MB/s)", fontsize=14)
+            ax1.set_yscale("log")
+            ax1.grid(True, alpha=0.3, axis="y")
+            ax1.legend(title="Category", bbox_to_anchor=(1.05, 1), loc="upper left")
+            ax1.tick_params(axis="x", rotation=45)
+
+            # Files per second for size categories
+            size_cats = ["tiny", "small", "medium", "large", "huge"]
+            df_sizes = df[df["Category"].isin(size_cats)]
+            if not df_sizes.empty:
+                df_pivot_files = df_sizes.pivot(index="Framework", columns="Category", values="Files/Second")
+                df_pivot_files.plot(kind="bar", ax=ax2, width=0.8)
+                ax2.set_title("Files Processed per Second (Size Categories)", fontsize=16, fontweight="bold")
+                ax2.set_ylabel("Files/Second", fontsize=14)
+                ax2.set_yscale("log")
+                ax2.grid(True, alpha=0.3, axis="y")
+                ax2.tick_params(axis="x", rotation=45)
+                ax2.legend(title="Category")
+
+            # Average throughput summary
+            avg_throughput = df.groupby("Framework", observed=True)["MB/Second"].mean().sort_values(ascending=False)
+            bars = ax3.barh(
+                avg_throughput.index,
+                avg_throughput.values,
+                color=_framework_colors(avg_throughput.index),
             )
+            ax3.set_title("Average Throughput Across All Categories", fontsize=16, fontweight="bold")
+            ax3.set_xlabel("Average MB/Second", fontsize=14)
+            ax3.grid(True, alpha=0.3, axis="x")
+
+            # Add value labels
+            ax3.bar_label(bars, fmt="{:.1f}", padding=3, fontsize=11)
 
-        plt.tight_layout()
-        output_path = self.output_dir / "throughput_analysis_comprehensive.png"
-        plt.savefig(output_path, bbox_inches="tight", dpi=150)
-        plt.close()
+            plt.tight_layout()
+            output_path = self.output_dir / "throughput_analysis_comprehensive.png"
+            plt.savefig(output_path, bbox_inches="tight", dpi=self.dpi)
         output_files.append(output_path)
 
         return output_files
@@ -425,147 +541,103 @@ class BenchmarkVisualizer:
         # This would require access to the detailed benchmark results
         return []
 
-    def _create_category_analysis(self, aggregated: AggregatedResults) -> list[Path]:  # noqa: C901, PLR0912
+    def _create_category_analysis(self, summary_df: pd.DataFrame) -> list[Path]:
         """Create comprehensive category analysis."""
-        output_files = []
+        import seaborn as sns
 
-        # Aggregate data by category
-        category_data = {}
-        # Flatten framework summaries
-        all_summaries = []
-        for fw_summaries in aggregated.framework_summaries.values():
-            all_summaries.extend(fw_summaries)
-
-        for summary in all_summaries:
-            cat = summary.category
-            if cat not in category_data:
-                category_data[cat] = {
-                    "frameworks": [],
-                    "avg_times": [],
-                    "success_rates": [],
-                    "throughputs": [],
-                }
+        plt = _pyplot()
+        output_files = []
 
-            category_data[cat]["frameworks"].append(
-                summary.framework.value if hasattr(summary.framework, "value") else str(summary.framework)
-            )
-            category_data[cat]["avg_times"].append(summary.avg_extraction_time)
-            category_data[cat]["success_rates"].append(summary.success_rate)
-            category_data[cat]["throughputs"].append(summary.mb_per_second or 0)
+        if summary_df.empty:
+            return output_files
 
         # Create comprehensive category comparison
-        fig = plt.figure(figsize=(24, 20))
-        gs = fig.add_gridspec(3, 2, hspace=0.3, wspace=0.2)
-
-        # 1. Average time by category
-        ax1 = fig.add_subplot(gs[0, :])
-        categories = list(category_data.keys())
-        avg_times_per_cat = []
-        for d in category_data.values():
-            valid_times = [t for t in d["avg_times"] if t is not None]
-            if valid_times:
-                avg_times_per_cat.append(sum(valid_times) / len(valid_times))
-            else:
-                avg_times_per_cat.append(0)
-
-        bars = ax1.bar(categories, avg_times_per_cat, color="skyblue", edgecolor="navy")
-        ax1.set_title("Average Extraction Time by Category (All Frameworks)", fontsize=18, fontweight="bold")
-        ax1.set_ylabel("Average Time (seconds)", fontsize=14)
-        ax1.set_yscale("log")
-        ax1.grid(True, alpha=0.3, axis="y")
-        ax1.tick_params(axis="x", rotation=45)
-
-        # Add value labels
-        for bar, val in zip(bars, avg_times_per_cat, strict=False):
-            ax1.text(
-                bar.get_x() + bar.get_width() / 2,
-                bar.get_height(),
-                f"{val:.3f}s",
-                ha="center",
-                va="bottom",
-                fontsize=10,
+        with _new_figure((24, 20)) as fig:
+            gs = fig.add_gridspec(3, 2, hspace=0.3, wspace=0.2)
+
+            # 1. Average time by category
+            ax1 = fig.add_subplot(gs[0, :])
+            cat_times = summary_df.groupby("category", sort=False, observed=True)["avg_time"].mean().fillna(0)
+            categories = cat_times.index.tolist()
+            avg_times_per_cat = cat_times.tolist()
+
+            bars = ax1.bar(categories, avg_times_per_cat, color="skyblue", edgecolor="navy")
+            ax1.set_title("Average Extraction Time by Category (All Frameworks)", fontsize=18, fontweight="bold")
+            ax1.set_ylabel("Average Time (seconds)", fontsize=14)
+            ax1.set_yscale("log")
+            ax1.grid(True, alpha=0.3, axis="y")
+            ax1.tick_params(axis="x", rotation=45)
+
+            # Add value labels
+            ax1.bar_label(bars, fmt="{:.3f}s", fontsize=10)
+
+            # 2. Success rate distribution
+            ax2 = fig.add_subplot(gs[1, 0])
+            rated = summary_df[summary_df["success_rate"].notna()]
+            df_success = pd.DataFrame(
+                {
+                    "Category": rated["category"].cat.remove_unused_categories(),
+                    "Success Rate": rated["success_rate"] * 100,
+                }
+            )
+            df_success.boxplot(column="Success Rate", by="Category", ax=ax2)
+            ax2.set_title("Success Rate Distribution by Category", fontsize=16, fontweight="bold")
+            ax2.set_ylabel("Success Rate (%)", fontsize=14)
+            ax2.set_xlabel("")
+            plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45)
+
+            # 3. Throughput distribution
+            ax3 = fig.add_subplot(gs[1, 1])
+            throughput = summary_df[summary_df["mb_per_second"] > 0]
+
+            if not throughput.empty:
+                df_throughput = pd.DataFrame(
+                    {
+                        "Category": throughput["category"].cat.remove_unused_categories(),
+                        "Throughput": throughput["mb_per_second"],
+                    }
+                )
+                df_throughput.boxplot(column="Throughput", by="Category", ax=ax3)
+                ax3.set_title("Throughput Distribution by Category", fontsize=16, fontweight="bold")
+                ax3.set_ylabel("Throughput (MB/s)", fontsize=14)
+                ax3.set_yscale("log")
+                ax3.set_xlabel("")
+                plt.setp(ax3.xaxis.get_majorticklabels(), rotation=45)
+
+            # 4. Framework performance heatmap by category
+            ax4 = fig.add_subplot(gs[2, :])
+
+            # Create performance matrix, keeping the first summary of each framework/category pair
+            perf_matrix = (
+                summary_df.drop_duplicates(["framework", "category"])
+                .pivot(index="framework", columns="category", values="avg_time")
+                .rename_axis(index=None, columns=None)
             )
 
-        # 2. Success rate distribution
-        ax2 = fig.add_subplot(gs[1, 0])
-        success_data = []
-        for cat, data in category_data.items():
-            for rate in data["success_rates"]:
-                if rate is not None:
-                    success_data.append({"Category": cat, "Success Rate": rate * 100})
-
-        df_success = pd.DataFrame(success_data)
-        df_success.boxplot(column="Success Rate", by="Category", ax=ax2)
-        ax2.set_title("Success Rate Distribution by Category", fontsize=16, fontweight="bold")
-        ax2.set_ylabel("Success Rate (%)", fontsize=14)
-        ax2.set_xlabel("")
-        plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45)
-
-        # 3. Throughput distribution
-        ax3 = fig.add_subplot(gs[1, 1])
-        throughput_data = []
-        for cat, data in category_data.items():
-            for tp in data["throughputs"]:
-                if tp > 0:
-                    throughput_data.append({"Category": cat, "Throughput": tp})
-
-        if throughput_data:
-            df_throughput = pd.DataFrame(throughput_data)
-            df_throughput.boxplot(column="Throughput", by="Category", ax=ax3)
-            ax3.set_title("Throughput Distribution by Category", fontsize=16, fontweight="bold")
-            ax3.set_ylabel("Throughput (MB/s)", fontsize=14)
-            ax3.set_yscale("log")
-            ax3.set_xlabel("")
-            plt.setp(ax3.xaxis.get_majorticklabels(), rotation=45)
-
-        # 4. Framework performance heatmap by category
-        ax4 = fig.add_subplot(gs[2, :])
-
-        # Create performance matrix
-        frameworks = sorted({fw for data in category_data.values() for fw in data["frameworks"]})
-        categories = sorted(category_data.keys())
-
-        perf_matrix = []
-        for fw in frameworks:
-            row = []
-            for cat in categories:
-                if fw in category_data[cat]["frameworks"]:
-                    idx = category_data[cat]["frameworks"].index(fw)
-                    time = category_data[cat]["avg_times"][idx]
-                    row.append(time)
-                else:
-                    row.append(None)
-            perf_matrix.append(row)
-
-        # Convert to numpy array and create heatmap
-        import numpy as np
-
-        perf_array = np.array([[x if x is not None else np.nan for x in row] for row in perf_matrix])
-
-        sns.heatmap(
-            perf_array,
-            xticklabels=categories,
-            yticklabels=frameworks,
-            annot=True,
-            fmt=".3f",
-            cmap="YlOrRd",
-            cbar_kws={"label": "Average Time (seconds)"},
-            ax=ax4,
-        )
-        ax4.set_title("Framework Performance Heatmap by Category", fontsize=16, fontweight="bold")
+            sns.heatmap(
+                perf_matrix,
+                annot=True,
+                fmt=".3f",
+                cmap="YlOrRd",
+                cbar_kws={"label": "Average Time (seconds)"},
+                ax=ax4,
+            )
+            ax4.set_title("Framework Performance Heatmap by Category", fontsize=16, fontweight="bold")
 
-        plt.suptitle("Comprehensive Category Analysis", fontsize=22, fontweight="bold")
-        plt.tight_layout()
+            plt.suptitle("Comprehensive Category Analysis", fontsize=22, fontweight="bold")
+            plt.tight_layout()
 
-        output_path = self.output_dir / "category_analysis_comprehensive.png"
-        plt.savefig(output_path, bbox_inches="tight", dpi=150)
-        plt.close()
+            output_path = self.output_dir / "category_analysis_comprehensive.png"
+            plt.savefig(output_path, bbox_inches="tight", dpi=self.dpi)
         output_files.append(output_path)
 
         return output_files
 
-    def _create_interactive_dashboard(self, aggregated: AggregatedResults) -> Path:
+    def _create_interactive_dashboard(self, summary_df: pd.DataFrame) -> Path:
         """Create an interactive Plotly dashboard."""
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+
         # Create subplots
         fig = make_subplots(
             rows=3,
@@ -588,133 +660,156 @@ class BenchmarkVisualizer:
         )
 
         # Prepare data
-        perf_data = []
-        # Flatten framework summaries
-        all_summaries = []
-        for fw_summaries in aggregated.framework_summaries.values():
-            all_summaries.extend(fw_summaries)
-
-        for summary in all_summaries:
-            perf_data.append(
-                {
-                    "framework": str(summary.framework.value)
-                    if hasattr(summary.framework, "value")
-                    else str(summary.framework),
-                    "category": str(summary.category.value)
-                    if hasattr(summary.category, "value")
-                    else str(summary.category),
-                    "avg_time": summary.avg_extraction_time,
-                    "memory": summary.avg_peak_memory_mb or 0,
-                    "success_rate": (summary.success_rate * 100) if summary.success_rate is not None else 0,
-                    "throughput": summary.mb_per_second or 0,
-                }
+        df = pd.DataFrame(
+            {
+                "framework": summary_df["framework"],
+                "category": summary_df["category"],
+                "avg_time": summary_df["avg_time"],
+                "memory": summary_df["peak_memory_mb"].fillna(0),
+                "success_rate": summary_df["success_rate"].fillna(0) * 100,
+                "throughput": summary_df["mb_per_second"].fillna(0),
+            }
+        )
+
+        # 1. Average extraction time and 2. memory usage distribution, in one pass over the frameworks
+        time_bars: list[tuple[BaseTraceType, int, int]] = []
+        memory_boxes: list[tuple[BaseTraceType, int, int]] = []
+        for fw, fw_data in df.groupby("framework", sort=False, observed=True):
+            color = FRAMEWORK_COLORS.get(fw, DEFAULT_FRAMEWORK_COLOR)
+            memory = fw_data["memory"].to_numpy()
+            time_bars.append(
+                (
+                    go.Bar(
+                        name=fw,
+                        x=fw_data["category"].to_numpy(),
+                        y=fw_data["avg_time"].to_numpy(),
+                        marker_color=color,
+                    ),
+                    1,
+                    1,
+                )
             )
+            if memory.sum() > 0:
+                memory_boxes.append((go.Box(name=fw, y=memory, marker_color=color), 1, 2))
 
-        df = pd.DataFrame(perf_data)
+        # Collect every trace with its subplot cell, then add them to the figure in one batch
+        traces = [*time_bars, *memory_boxes]
 
-        # 1. Average extraction time
-        for fw in df["framework"].unique():
-            fw_data = df[df["framework"] == fw]
-            fig.add_trace(
+        # 3. Success rate comparison
+        fw_success = df.groupby("framework", observed=True)["success_rate"].mean()
+        traces.append(
+            (
                 go.Bar(
-                    name=fw,
-                    x=fw_data["category"],
-                    y=fw_data["avg_time"],
-                    marker_color=FRAMEWORK_COLORS.get(fw, "#999999"),
+                    x=fw_success.index,
+                    y=fw_success.values,
+                    marker_color=_framework_colors(fw_success.index),
+                    showlegend=False,
                 ),
-                row=1,
-                col=1,
+                2,
+                1,
             )
-
-        # 2. Memory usage distribution
-        for fw in df["framework"].unique():
-            fw_data = df[df["framework"] == fw]
-            if fw_data["memory"].sum() > 0:
-                fig.add_trace(
-                    go.Box(name=fw, y=fw_data["memory"], marker_color=FRAMEWORK_COLORS.get(fw, "#999999")), row=1, col=2
-                )
-
-        # 3. Success rate comparison
-        fw_success = df.groupby("framework")["success_rate"].mean()
-        fig.add_trace(
-            go.Bar(
-                x=fw_success.index,
-                y=fw_success.values,
-                marker_color=[FRAMEWORK_COLORS.get(fw, "#999999") for fw in fw_success.index],
-                showlegend=False,
-            ),
-            row=2,
-            col=1,
         )
 
-        # 4. Throughput scatter
-        fig.add_trace(
-            go.Scatter(
-                x=df["avg_time"],
-                y=df["throughput"],
-                mode="markers",
-                marker={
-                    "size": 10,
-                    "color": [FRAMEWORK_COLORS.get(fw, "#999999") for fw in df["framework"]],
-                    "line": {"width": 1, "color": "white"},
-                },
-                text=df["framework"] + " - " + df["category"],
-                showlegend=False,
-            ),
-            row=2,
-            col=2,
+        # 4. Throughput scatter, drawn with WebGL rather than one SVG node per point
+        traces.append(
+            (
+                go.Scattergl(
+                    x=df["avg_time"].to_numpy(),
+                    y=df["throughput"].to_numpy(),
+                    mode="markers",
+                    marker={
+                        "size": 10,
+                        "color": _framework_colors(df["framework"]),
+                        "line": {"width": 1, "color": "white"},
+                    },
+                    text=(df["framework"].astype(str) + " - " + df["category"].astype(str)).to_numpy(),
+                    showlegend=False,
+                ),
+                2,
+                2,
+            )
         )
 
         # 5. Performance heatmap
-        pivot_table = df.pivot_table(values="avg_time", index="framework", columns="category")
-        fig.add_trace(
-            go.Heatmap(
-                z=pivot_table.values, x=pivot_table.columns, y=pivot_table.index, colorscale="YlOrRd", showscale=True
-            ),
-            row=3,
-            col=1,
+        pivot_table = df.pivot_table(values="avg_time", index="framework", columns="category", observed=True)
+        traces.append(
+            (
+                go.Heatmap(
+                    z=pivot_table.values,
+                    x=pivot_table.columns,
+                    y=pivot_table.index,
+                    colorscale="YlOrRd",
+                    showscale=True,
+                ),
+                3,
+                1,
+            )
         )
 
+        data, rows, cols = zip(*traces, strict=True)
+        fig.add_traces(list(data), rows=list(rows), cols=list(cols))
+
         # 6. File size vs extraction time (skip - requires detailed results)
         # This would require access to individual benchmark results
 
-        # Update layout
+        # Update layout and axes together; subplot axes are numbered row by row (xaxis, xaxis2, ...)
         fig.update_layout(
             height=1800,
             showlegend=True,
             title={"text": "Python Text Extraction Benchmarks - Interactive Dashboard", "font": {"size": 24}},
+            xaxis={"title_text": "Category"},
+            yaxis={"title_text": "Time (s)", "type": "log"},
+            yaxis2={"title_text": "Memory (MB)"},
+            xaxis3={"title_text": "Framework"},
+            yaxis3={"title_text": "Success Rate (%)"},
+            xaxis4={"title_text": "Avg Time (s)", "type": "log"},
+            yaxis4={"title_text": "Throughput (MB/s)", "type": "log"},
+            xaxis6={"title_text": "File Size (MB)", "type": "log"},
+            yaxis6={"title_text": "Extraction Time (s)", "type": "log"},
         )
 
-        # Update axes
-        fig.update_xaxes(title_text="Category", row=1, col=1)
-        fig.update_yaxes(title_text="Time (s)", type="log", row=1, col=1)
-
-        fig.update_yaxes(title_text="Memory (MB)", row=1, col=2)
+        # Save interactive HTML
+        output_path = self.output_dir / "interactive_dashboard.html"
+        fig.write_html(str(output_path), include_plotlyjs="cdn", validate=False)
 
-        fig.update_xaxes(title_text="Framework", row=2, col=1)
-        fig.update_yaxes(title_text="Success Rate (%)", row=2, col=1)
+        return output_path
 
-        fig.update_xaxes(title_text="Avg Time (s)", type="log", row=2, col=2)
-        fig.update_yaxes(title_text="Throughput (MB/s)", type="log", row=2, col=2)
+    def _summary_totals(self, summaries_by_key: dict[Any, list[BenchmarkSummary]]) -> pd.DataFrame:
+        """Sum file counts per key in one groupby, with throughput and memory weighted by file count.
 
-        fig.update_xaxes(title_text="File Size (MB)", type="log", row=3, col=2)
-        fig.update_yaxes(title_text="Extraction Time (s)", type="log", row=3, col=2)
+        Keys keep their mapping order, and keys without summaries get zero totals.
+        """
+        summaries = [summary for key_summaries in summaries_by_key.values() for summary in key_summaries]
+        total_files = np.array([summary.total_files for summary in summaries], dtype=np.int64)
+        files_per_second = np.array([summary.files_per_second for summary in summaries], dtype=np.float64)
+        peak_memory = np.array([summary.avg_peak_memory_mb for summary in summaries], dtype=np.float64)
 
-        # Save interactive HTML
-        output_path = self.output_dir / "interactive_dashboard.html"
-        fig.write_html(str(output_path), include_plotlyjs="cdn")
+        frame = pd.DataFrame(
+            {
+                "key": [key for key, key_summaries in summaries_by_key.items() for _ in key_summaries],
+                "total_files": total_files,
+                "successful_files": np.array([summary.successful_files for summary in summaries], dtype=np.int64),
+                "weighted_files_per_second": np.nan_to_num(files_per_second) * total_files,
+                "weighted_memory_mb": np.nan_to_num(peak_memory) * total_files,
+            }
+        )
+        return frame.groupby("key", sort=False).sum().reindex(list(summaries_by_key), fill_value=0)
 
-        return output_path
+    def generate_summary_metrics(self, aggregated_file: Path, *, use_cache: bool = False) -> dict:
+        """Generate summary metrics from aggregated results.
 
-    def generate_summary_metrics(self, aggregated_file: Path) -> dict:
-        """Generate summary metrics from aggregated results."""
-        with open(aggregated_file, "rb") as f:
-            aggregated = msgspec.json.decode(f.read(), type=AggregatedResults)
+        With use_cache, the metrics are stored in the output directory together with the path, mtime and size of
+        the aggregated file, and reused for as long as all three still match.
+        """
+        cache_path = self.output_dir / "summary_metrics.msgpack"
+        source_path, mtime_ns, size = self._source_key(aggregated_file)
+        source = {"source": str(source_path), "mtime_ns": mtime_ns, "size": size}
+        if use_cache and cache_path.exists():
+            cached = msgspec.msgpack.decode(cache_path.read_bytes())
+            if {name: cached.get(name) for name in source} == source:
+                return cached["metrics"]
 
-        # Flatten all summaries
-        all_summaries = []
-        for fw_summaries in aggregated.framework_summaries.values():
-            all_summaries.extend(fw_summaries)
+        aggregated = self._load_aggregated(aggregated_file)
 
         # Calculate overall metrics
         metrics = {
@@ -727,37 +822,42 @@ class BenchmarkVisualizer:
         }
 
         # Framework performance
-        for framework, summaries in aggregated.framework_summaries.items():
-            total_files = sum(s.total_files for s in summaries)
-            successful_files = sum(s.successful_files for s in summaries)
-            avg_speed = (
-                sum((s.files_per_second or 0) * s.total_files for s in summaries) / total_files
-                if total_files > 0
-                else 0
-            )
-            avg_memory = (
-                sum((s.avg_peak_memory_mb or 0) * s.total_files for s in summaries) / total_files
-                if total_files > 0
-                else 0
-            )
-
+        totals = self._summary_totals(aggregated.framework_summaries)
+        total_files = totals["total_files"]
+        success_rate = (totals["successful_files"] / total_files).where(total_files > 0, 0)
+        avg_speed = (totals["weighted_files_per_second"] / total_files).where(total_files > 0, 0)
+        avg_memory = (totals["weighted_memory_mb"] / total_files).where(total_files > 0, 0)
+        for framework, files, successful, rate, speed, memory in zip(
+            totals.index,
+            total_files.tolist(),
+            totals["successful_files"].tolist(),
+            success_rate.tolist(),
+            avg_speed.tolist(),
+            avg_memory.tolist(),
+            strict=True,
+        ):
             metrics["framework_performance"][framework] = {
-                "total_files": total_files,
-                "successful_files": successful_files,
-                "success_rate": successful_files / total_files if total_files > 0 else 0,
-                "avg_files_per_second": avg_speed,
-                "avg_memory_mb": avg_memory,
+                "total_files": files,
+                "successful_files": successful,
+                "success_rate": rate,
+                "avg_files_per_second": speed,
+                "avg_memory_mb": memory,
             }
 
         # Category performance
-        for category, summaries in aggregated.category_summaries.items():
-            total_files = sum(s.total_files for s in summaries)
-            successful_files = sum(s.successful_files for s in summaries)
-
+        totals = self._summary_totals(aggregated.category_summaries)
+        total_files = totals["total_files"]
+        success_rate = (totals["successful_files"] / total_files).where(total_files > 0, 0)
+        for category, files, successful, rate in zip(
+            totals.index, total_files.tolist(), totals["successful_files"].tolist(), success_rate.tolist(), strict=True
+        ):
             metrics["category_performance"][category] = {
-                "total_files": total_files,
-                "successful_files": successful_files,
-                "success_rate": successful_files / total_files if total_files > 0 else 0,
+                "total_files": files,
+                "successful_files": successful,
+                "success_rate": rate,
             }
 
+        if use_cache:
+            cache_path.write_bytes(msgspec.msgpack.encode({**source, "metrics": metrics}))
+
         return metrics
@@ -199,6 +199,27 @@ class TestResultAggregator:
             for key in matrix:
                 assert isinstance(key, str)
 
+    def test_save_results_as_msgpack(self, temp_results_dirs: list[Path]) -> None:
+        """Test the optional msgpack copy decodes to the same aggregated results."""
+        aggregator = ResultAggregator()
+
+        aggregated = aggregator.aggregate_results(temp_results_dirs)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir)
+
+            aggregator.save_results(aggregated, output_dir)
+            assert not (output_dir / "aggregated_results.msgpack").exists()
+
+            aggregator.save_results(aggregated, output_dir, msgpack=True)
+            from_json = msgspec.json.decode(
+                (output_dir / "aggregated_results.json").read_bytes(), type=AggregatedResults
+            )
+            from_msgpack = msgspec.msgpack.decode(
+                (output_dir / "aggregated_results.msgpack").read_bytes(), type=AggregatedResults
+            )
+            assert from_msgpack == from_json
+
     def test_framework_summaries_structure(self, temp_results_dirs: list[Path]) -> None:
         """Test framework summaries are properly structured."""
         aggregator = ResultAggregator()
@@ -0,0 +1,206 @@
+"""Tests for table extraction analysis scoring."""
+
+import json
+
+import msgspec
+import pytest
+
+from src import table_analysis
+from src.table_analysis import TableExtractionAnalyzer, analyze_table_extraction_from_results
+from src.types import BenchmarkResult, DocumentCategory, ExtractionStatus, FileType, Framework
+
+
+def _result(
+    file_path: str,
+    framework: Framework = Framework.KREUZBERG_SYNC,
+    status: ExtractionStatus = ExtractionStatus.SUCCESS,
+    extracted_text: str | None = "| Name | Price |\n| Apples | 1.99 |",
+    extraction_time: float = 0.5,
+) -> BenchmarkResult:
+    return BenchmarkResult(
+        file_path=file_path,
+        file_size=1024,
+        file_type=FileType.XLSX,
+        category=DocumentCategory.SMALL,
+        framework=framework,
+        iteration=1,
+        extraction_time=extraction_time,
+        peak_memory_mb=10.0,
+        avg_memory_mb=8.0,
+        peak_cpu_percent=50.0,
+        avg_cpu_percent=25.0,
+        status=status,
+        extracted_text=extracted_text,
+    )
+
+
+class TestTableStructureScoring:
+    """Test structure and detection scores for extracted text."""
+
+    @pytest.fixture
+    def analyzer(self):
+        """Create an analyzer without results."""
+        return TableExtractionAnalyzer([])
+
+    def test_empty_text_scores_zero(self, analyzer):
+        """Test that empty text gets zero structure and detection scores."""
+        assert analyzer._score_text("", "table.csv") == (0.0, 0.0)  # noqa: SLF001
+
+    def test_markdown_table_structure_weights(self, analyzer):
+        """Test that markdown tables add up the structure indicator weights."""
+        # markdown (0.25) + table headers (0.10) + numeric data (0.05)
+        structure_score, _ = analyzer._score_text("| Name | Price |\n| Apples | 1.99 |", "report.pdf")  # noqa: SLF001
+        assert structure_score == pytest.approx(0.40)
+
+    def test_csv_bonus_and_cap(self, analyzer):
+        """Test that CSV files get the format bonus and the score is capped at 1.0."""
+        text = "Name,Price,Total\n| a | b |\nx\ty\tz\n   Item   Amount 3"
+        assert analyzer._score_text(text, "data.csv")[0] == 1.0  # noqa: SLF001
+
+    def test_skipped_patterns_do_not_score(self, analyzer):
+        """Test that text without full table rows gets no structure score."""
+        # Two pipes and one comma cannot form a markdown table or CSV row
+        structure_score, _ = analyzer._score_text("a | b | c, d", "report.pdf")  # noqa: SLF001
+        assert structure_score == 0.0
+
+    def test_detection_uses_expected_content(self, analyzer):
+        """Test that expected table content only counts for its own file."""
+        text = "Blues STL 1\nFlyers PHI 2\nMaple Leafs TOR 13\n"
+        assert analyzer._score_text(text, "stanley-cups.xlsx")[1] == 1.0  # noqa: SLF001
+        assert analyzer._score_text(text, "other.xlsx")[1] < 1.0  # noqa: SLF001
+
+    def test_detection_indicator_caps_at_four_matches(self, analyzer):
+        """Test that each detection indicator stops counting after four matches."""
+        few = analyzer._score_text("a,b", "report.pdf")[1]  # noqa: SLF001
+        many = analyzer._score_text("a,b,c,d,e,f,g,h", "report.pdf")[1]  # noqa: SLF001
+        # separators: 1 match -> 0.05, capped -> 0.2
+        assert many - few == pytest.approx(0.15)
+
+    def test_structured_data_matches_original_text(self, analyzer):
+        """Test that letter codes are counted on the original text, whose length lowering can change."""
+        # "İ" lowers to two characters, which would split "KİaK" into two letter codes instead of one
+        assert analyzer._score_text("75KİaK7Y", "report.pdf")[1] == pytest.approx(0.05)  # noqa: SLF001
+
+
+class TestTableFileAnalysis:
+    """Test table file identification and per-framework aggregation."""
+
+    def test_identify_table_files(self):
+        """Test that table files are identified once each by file name."""
+        results = [
+            _result("/data/stanley-cups.xlsx"),
+            _result("/data/stanley-cups.xlsx", framework=Framework.KREUZBERG_ASYNC),
+            _result("/data/Simple-Table.html"),
+            _result("/data/notes.txt"),
+        ]
+        analyzer = TableExtractionAnalyzer(results)
+        assert sorted(analyzer.table_files) == ["/data/Simple-Table.html", "/data/stanley-cups.xlsx"]
+
+    def test_analysis_groups_by_framework_and_file(self):
+        """Test that the analysis groups results by framework and by file."""
+        results = [
+            _result("/data/stanley-cups.xlsx"),
+            _result("/data/stanley-cups.xlsx", framework=Framework.KREUZBERG_ASYNC, status=ExtractionStatus.FAILED),
+            _result("/data/notes.txt"),
+        ]
+        analysis = TableExtractionAnalyzer(results).analyze_table_extraction_quality()
+
+        assert analysis["total_table_files"] == 1
+        assert set(analysis["framework_analysis"]) == {"kreuzberg_sync", "kreuzberg_async"}
+        assert analysis["framework_analysis"]["kreuzberg_sync"]["success_rate"] == 1.0
+        assert analysis["framework_analysis"]["kreuzberg_async"]["success_rate"] == 0.0
+
+        file_analysis = analysis["file_analysis"]["/data/stanley-cups.xlsx"]
+        assert file_analysis["best_extraction"] == "kreuzberg_sync"
+        assert file_analysis["table_complexity"] == "spreadsheet"
+        assert analysis["summary"]["best_framework_structure"] == "kreuzberg_sync"
+
+    def test_each_result_is_scored_once(self, monkeypatch):
+        """Test that each result's text is scored only once."""
+        results = [
+            _result("/data/stanley-cups.xlsx"),
+            _result("/data/stanley-cups.xlsx", framework=Framework.KREUZBERG_ASYNC),
+        ]
+        analyzer = TableExtractionAnalyzer(results)
+        calls = []
+        score_text = analyzer._score_text  # noqa: SLF001
+        monkeypatch.setattr(analyzer, "_score_text", lambda *args: calls.append(args) or score_text(*args))
+
+        analyzer.analyze_table_extraction_quality()
+
+        assert len(calls) == len(results)
+
+    def test_framework_averages_match_python_sum(self, monkeypatch):
+        """Test that framework averages are exact sum()/len() values, without pairwise summation drift."""
+        scores = [0.65, 0.95, 0.35, 0.35, 0.0, 0.15, 0.7, 0.4]
+        results = [_result(f"/data/table-{i}.xlsx") for i in range(len(scores))]
+        analyzer = TableExtractionAnalyzer(results)
+        score_by_path = {r.file_path: score for r, score in zip(results, scores, strict=True)}
+        monkeypatch.setattr(analyzer, "_score_text", lambda _text, file_path: (score_by_path[file_path], 0.0))
+
+        framework_analysis = analyzer.analyze_table_extraction_quality()["framework_analysis"]["kreuzberg_sync"]
+
+        assert framework_analysis["avg_structure_score"] == sum(scores) / len(scores)
+
+    def test_report_files_are_written(self, tmp_path):
+        """Test that the JSON, markdown and CSV reports are written."""
+        results = [
+            _result("/data/stanley-cups.xlsx"),
+            _result("/data/simple-table.csv", framework=Framework.KREUZBERG_ASYNC),
+        ]
+        TableExtractionAnalyzer(results).generate_table_analysis_report(tmp_path)
+
+        analysis = json.loads((tmp_path / "table_extraction_analysis.json").read_text())
+        assert analysis["total_table_files"] == 2
+        assert set(analysis["framework_analysis"]) == {"kreuzberg_sync", "kreuzberg_async"}
+        assert (tmp_path / "table_extraction_report.md").read_text().startswith("# Table Extraction Analysis Report")
+        assert (tmp_path / "table_extraction_summary.csv").read_text().startswith("Framework,")
+
+    def test_threaded_framework_analysis_matches_serial(self, monkeypatch):
+        """Test that the threaded framework analysis gives the same result as the serial one."""
+        results = [
+            _result(f"/data/{name}", framework=framework)
+            for name in ("stanley-cups.xlsx", "simple-table.html", "data.csv")
+            for framework in (Framework.KREUZBERG_SYNC, Framework.KREUZBERG_ASYNC, Framework.EXTRACTOUS)
+        ]
+        serial = TableExtractionAnalyzer(results).analyze_table_extraction_quality()
+
+        monkeypatch.setattr(table_analysis, "_FREE_THREADED", True)
+        threaded = TableExtractionAnalyzer(results).analyze_table_extraction_quality()
+
+        assert list(threaded["framework_analysis"]) == list(serial["framework_analysis"])
+        assert threaded == serial
+
+    def test_analysis_from_results_file_skips_non_table_results(self, tmp_path):
+        """Test that analyzing a results file matches in-memory analysis of its table results."""
+        results = [
+            _result("/data/stanley-cups.xlsx"),
+            _result("/data/notes.txt", extracted_text="x" * 10_000),
+            _result("/data/simple-table.csv", framework=Framework.KREUZBERG_ASYNC),
+        ]
+        results_file = tmp_path / "results.json"
+        results_file.write_bytes(msgspec.json.encode(results))
+
+        analyze_table_extraction_from_results(results_file, tmp_path / "out")
+
+        from_file = json.loads((tmp_path / "out" / "table_extraction_analysis.json").read_text())
+        in_memory = TableExtractionAnalyzer(results).analyze_table_extraction_quality()
+        assert from_file["total_table_files"] == 2
+        assert from_file["framework_analysis"] == json.loads(msgspec.json.encode(in_memory["framework_analysis"]))
+
+    def test_release_text_keeps_scores(self):
+        """Test that releasing extracted text after scoring keeps the analysis unchanged."""
+
+        def results():
+            return [
+                _result("/data/stanley-cups.xlsx"),
+                _result("/data/simple-table.csv", framework=Framework.KREUZBERG_ASYNC),
+                _result("/data/data.csv", status=ExtractionStatus.FAILED),
+            ]
+
+        expected = TableExtractionAnalyzer(results()).analyze_table_extraction_quality()
+        released = results()
+        analyzer = TableExtractionAnalyzer(iter(released), release_text=True)
+
+        assert [r.extracted_text for r in released[:2]] == [None, None]
+        assert analyzer.analyze_table_extraction_quality() == expected
@@ -0,0 +1,78 @@
+"""Tests for splicing benchmark results into the README."""
+
+import pytest
+
+from src.update_readme import update_readme_with_results
+
+SECTION_HEADING = "## 📊 Latest Benchmark Results"
+
+
+@pytest.fixture
+def summary_metrics():
+    """Create summary metrics for two frameworks."""
+    return {
+        "timestamp": 1_700_000_000,
+        "total_files": 1234,
+        "total_time": 56.78,
+        "frameworks_tested": 2,
+        "categories_tested": 3,
+        "best_framework": "kreuzberg_sync",
+        "framework_stats": {
+            "kreuzberg_sync": {"success_rate": 95.5, "avg_time": 0.5, "total_files": 100},
+            "docling": {"success_rate": 75.0, "avg_time": 2.25, "total_files": 90},
+        },
+    }
+
+
+def _update(tmp_path, summary_metrics, content: str | None, run_id: str | None = None) -> str:
+    readme = tmp_path / "README.md"
+    if content is not None:
+        readme.write_text(content)
+    update_readme_with_results(readme, summary_metrics, tmp_path, run_id)
+    return readme.read_text()
+
+
+def test_section_rows_and_run_id(tmp_path, summary_metrics):
+    """Test that a new README gets the results table rows and the run ID."""
+    content = _update(tmp_path, summary_metrics, None, run_id="42")
+
+    assert content.startswith("# Python Text Extraction Libraries Benchmarks\n")
+    assert "*Run ID: 42*" in content
+    assert [path.name for path in tmp_path.iterdir()] == ["README.md"]
+    assert "| kreuzberg_sync | 95.5% | 0.50s | 100 | 🟢 |\n" in content
+    assert "| docling | 75.0% | 2.25s | 90 | 🟡 |\n" in content
+
+
+def test_no_run_id_line_without_run_id(tmp_path, summary_metrics):
+    """Test that the run ID line is left out when no run ID is given."""
+    content = _update(tmp_path, summary_metrics, None)
+
+    assert "Run ID" not in content
+    assert "UTC*\n\n### Summary\n" in content
+
+
+def test_existing_section_is_replaced(tmp_path, summary_metrics):
+    """Test that an existing results section is replaced up to its end marker."""
+    content = _update(tmp_path, summary_metrics, f"# Title\n\n{SECTION_HEADING}\nold results\n---\n## After\nkeep\n")
+
+    assert content.count(SECTION_HEADING) == 1
+    assert "old results" not in content
+    assert content.startswith(f"# Title\n\n\n{SECTION_HEADING}")
+    assert content.endswith("---\n## After\nkeep\n")
+
+
+def test_section_without_end_marker_replaces_the_rest(tmp_path, summary_metrics):
+    """Test that a results section without an end marker is replaced to the end of the file."""
+    content = _update(tmp_path, summary_metrics, f"# Title\n{SECTION_HEADING}\nold results")
+
+    assert "old results" not in content
+    assert content.endswith("---\n")
+
+
+def test_section_is_inserted_after_main_heading(tmp_path, summary_metrics):
+    """Test that a missing results section is inserted after the main heading."""
+    content = _update(tmp_path, summary_metrics, "## Badges\n# Title\nintro\n")
+
+    head, _, rest = content.partition(SECTION_HEADING)
+    assert head == "## Badges\n# Title\n\n"
+    assert rest.endswith("---\n\nintro\n")
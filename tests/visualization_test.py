@@ -1,8 +1,10 @@
 """Tests for visualization module to ensure proper handling of None values."""
 
+import os
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
+import matplotlib.pyplot as plt
 import msgspec
 import pytest
 
@@ -93,8 +95,9 @@ class TestVisualizationNoneHandling:
         visualizer = BenchmarkVisualizer(output_dir=tmp_path)
 
         # Mock matplotlib to avoid creating actual plots
+        summary_df = visualizer._build_summary_frame(sample_aggregated_results_with_nones)  # noqa: SLF001
         with patch("matplotlib.pyplot.savefig"):
-            output_files = visualizer._create_category_analysis(sample_aggregated_results_with_nones)  # noqa: SLF001
+            output_files = visualizer._create_category_analysis(summary_df)  # noqa: SLF001
 
         # Should complete without errors
         assert isinstance(output_files, list)
@@ -103,8 +106,10 @@ class TestVisualizationNoneHandling:
         """Test that performance comparison handles None success_rate values."""
         visualizer = BenchmarkVisualizer(output_dir=tmp_path)
 
+        summary_df = visualizer._build_summary_frame(sample_aggregated_results_with_nones)  # noqa: SLF001
+
         with patch("matplotlib.pyplot.savefig"):
-            output_files = visualizer._create_performance_comparison(sample_aggregated_results_with_nones)  # noqa: SLF001
+            output_files = visualizer._create_performance_comparison(summary_df)  # noqa: SLF001
 
         # Should complete without errors
         assert isinstance(output_files, list)
@@ -135,8 +140,9 @@ class TestVisualizationNoneHandling:
         visualizer = BenchmarkVisualizer(output_dir=tmp_path)
 
         # Mock plotly to avoid creating actual plots
+        summary_df = visualizer._build_summary_frame(sample_aggregated_results_with_nones)  # noqa: SLF001
         with patch("plotly.graph_objects.Figure"):
-            output_path = visualizer._create_interactive_dashboard(sample_aggregated_results_with_nones)  # noqa: SLF001
+            output_path = visualizer._create_interactive_dashboard(summary_df)  # noqa: SLF001
 
         # Should complete without errors
         assert isinstance(output_path, Path)
@@ -218,8 +224,183 @@ class TestVisualizationNoneHandling:
             platform_results={},
         )
 
+        summary_df = visualizer._build_summary_frame(aggregated)  # noqa: SLF001
+
         with patch("matplotlib.pyplot.savefig"):
-            output_files = visualizer._create_category_analysis(aggregated)  # noqa: SLF001
+            output_files = visualizer._create_category_analysis(summary_df)  # noqa: SLF001
 
         # Should complete without errors when encountering None success rates
         assert isinstance(output_files, list)
+
+    def test_summary_frame_flattens_summaries(self, sample_aggregated_results_with_nones, tmp_path):
+        """Test that the shared summary frame uses enum values and NaN for missing measurements."""
+        visualizer = BenchmarkVisualizer(output_dir=tmp_path)
+
+        summary_df = visualizer._build_summary_frame(sample_aggregated_results_with_nones)  # noqa: SLF001
+
+        assert summary_df["framework"].tolist() == ["kreuzberg_sync", "kreuzberg_sync"]
+        assert summary_df["category"].tolist() == ["tiny", "small"]
+        assert summary_df["avg_time"].dtype == "float64"
+        assert summary_df["mb_per_second"].isna().tolist() == [False, True]
+        assert summary_df["total_files"].tolist() == [10, 5]
+        assert visualizer._build_summary_frame(sample_aggregated_results_with_nones) is summary_df  # noqa: SLF001
+
+    def test_summary_metrics_weights_by_file_count(self, sample_aggregated_results_with_nones, tmp_path):
+        """Test that summary metrics weight averages by file count and keep keys without summaries."""
+        visualizer = BenchmarkVisualizer(output_dir=tmp_path)
+        aggregated = msgspec.structs.replace(
+            sample_aggregated_results_with_nones,
+            category_summaries={
+                "tiny": sample_aggregated_results_with_nones.framework_summaries["kreuzberg_sync"][:1],
+                "huge": [],
+            },
+        )
+        test_file = tmp_path / "test_aggregated.json"
+        test_file.write_bytes(msgspec.json.encode(aggregated))
+
+        metrics = visualizer.generate_summary_metrics(test_file)
+
+        fw_metrics = metrics["framework_performance"]["kreuzberg_sync"]
+        assert fw_metrics["total_files"] == 15
+        assert fw_metrics["successful_files"] == 13
+        assert fw_metrics["avg_files_per_second"] == pytest.approx(2.0 * 10 / 15)
+        assert fw_metrics["avg_memory_mb"] == pytest.approx(100.0 * 10 / 15)
+        assert metrics["category_performance"] == {
+            "tiny": {"total_files": 10, "successful_files": 8, "success_rate": 0.8},
+            "huge": {"total_files": 0, "successful_files": 0, "success_rate": 0},
+        }
+
+    def test_no_visualizations_without_summaries(self, sample_aggregated_results_with_nones, tmp_path):
+        """Test that empty aggregated results produce no charts instead of failing."""
+        visualizer = BenchmarkVisualizer(output_dir=tmp_path / "charts")
+        aggregated = msgspec.structs.replace(sample_aggregated_results_with_nones, framework_summaries={})
+        test_file = tmp_path / "test_aggregated.json"
+        test_file.write_bytes(msgspec.json.encode(aggregated))
+
+        assert visualizer.generate_all_visualizations(test_file) == []
+        assert not any((tmp_path / "charts").iterdir())
+
+    def test_summary_metrics_cache_follows_aggregated_file(self, sample_aggregated_results_with_nones, tmp_path):
+        """Test that cached summary metrics are reused until the aggregated file changes."""
+        visualizer = BenchmarkVisualizer(output_dir=tmp_path / "charts")
+        test_file = tmp_path / "test_aggregated.json"
+        test_file.write_bytes(msgspec.json.encode(sample_aggregated_results_with_nones))
+
+        metrics = visualizer.generate_summary_metrics(test_file, use_cache=True)
+        cache_path = tmp_path / "charts" / "summary_metrics.msgpack"
+        cached = msgspec.msgpack.decode(cache_path.read_bytes())
+        assert cached["metrics"] == metrics
+        assert visualizer.generate_summary_metrics(test_file, use_cache=True) == metrics
+
+        cache_path.write_bytes(msgspec.msgpack.encode({**cached, "metrics": {"cached": True}}))
+        assert visualizer.generate_summary_metrics(test_file, use_cache=True) == {"cached": True}
+
+        # A restored copy with an older mtime is still a different version of the file
+        stat = test_file.stat()
+        os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns - 1_000_000_000))
+        assert visualizer.generate_summary_metrics(test_file, use_cache=True) == metrics
+        assert not (tmp_path / "test_aggregated.summary.msgpack").exists()
+
+    def test_aggregated_file_is_decoded_once(self, sample_aggregated_results_with_nones, tmp_path, monkeypatch):
+        """Test that the aggregated file is decoded once per version across entry points."""
+        visualizer = BenchmarkVisualizer(output_dir=tmp_path / "charts")
+        test_file = tmp_path / "test_aggregated.json"
+        test_file.write_bytes(msgspec.json.encode(sample_aggregated_results_with_nones))
+        decoder = Mock(wraps=BenchmarkVisualizer._DECODER)  # noqa: SLF001
+        monkeypatch.setattr(BenchmarkVisualizer, "_DECODER", decoder)
+
+        with patch("matplotlib.pyplot.savefig"):
+            visualizer.generate_all_visualizations(test_file)
+        visualizer.generate_summary_metrics(test_file)
+        assert decoder.decode.call_count == 1
+
+        stat = test_file.stat()
+        os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        visualizer.generate_summary_metrics(test_file)
+        assert decoder.decode.call_count == 2
+
+    def test_msgpack_aggregated_file(self, sample_aggregated_results_with_nones, tmp_path):
+        """Test that msgpack aggregated files give the same metrics as JSON ones."""
+        visualizer = BenchmarkVisualizer(output_dir=tmp_path)
+        json_file = tmp_path / "aggregated.json"
+        json_file.write_bytes(msgspec.json.encode(sample_aggregated_results_with_nones))
+        msgpack_file = tmp_path / "aggregated.msgpack"
+        msgpack_file.write_bytes(msgspec.msgpack.encode(sample_aggregated_results_with_nones))
+
+        assert visualizer.generate_summary_metrics(msgpack_file) == visualizer.generate_summary_metrics(json_file)
+
+    def test_charts_use_configured_dpi(self, sample_aggregated_results_with_nones, tmp_path):
+        """Test that PNG charts are saved at the visualizer's DPI."""
+        visualizer = BenchmarkVisualizer(output_dir=tmp_path, dpi=72)
+
+        summary_df = visualizer._build_summary_frame(sample_aggregated_results_with_nones)  # noqa: SLF001
+
+        with patch("matplotlib.pyplot.savefig") as savefig:
+            visualizer._create_performance_comparison(summary_df)  # noqa: SLF001
+
+        assert savefig.call_args_list
+        assert all(call.kwargs["dpi"] == 72 for call in savefig.call_args_list)
+
+    def test_parallel_charts_match_serial(self, sample_aggregated_results_with_nones, tmp_path, monkeypatch):
+        """Test that charts rendered in worker processes produce the same files as serial rendering."""
+        test_file = tmp_path / "test_aggregated.json"
+        test_file.write_bytes(msgspec.json.encode(sample_aggregated_results_with_nones))
+
+        monkeypatch.setattr(os, "cpu_count", lambda: 1)
+        serial = BenchmarkVisualizer(output_dir=tmp_path / "serial").generate_all_visualizations(test_file)
+        monkeypatch.setattr(os, "cpu_count", lambda: 2)
+        monkeypatch.setattr(BenchmarkVisualizer, "_PARALLEL_CHART_MIN_ROWS", 0)
+        parallel = BenchmarkVisualizer(output_dir=tmp_path / "parallel").generate_all_visualizations(test_file)
+
+        assert [path.name for path in parallel] == [path.name for path in serial]
+        assert all(path.exists() for path in parallel)
+
+    def test_visualization_cache_follows_aggregated_file(self, sample_aggregated_results_with_nones, tmp_path):
+        """Test that cached charts are reused until the aggregated file changes or a chart goes missing."""
+        visualizer = BenchmarkVisualizer(output_dir=tmp_path / "charts")
+        test_file = tmp_path / "test_aggregated.json"
+        test_file.write_bytes(msgspec.json.encode(sample_aggregated_results_with_nones))
+
+        with patch("matplotlib.pyplot.savefig"):
+            output_files = visualizer.generate_all_visualizations(test_file, use_cache=True)
+        for path in output_files:
+            path.touch()
+
+        with patch.object(visualizer, "_load_aggregated") as load_aggregated:
+            assert visualizer.generate_all_visualizations(test_file, use_cache=True) == output_files
+            load_aggregated.assert_not_called()
+
+            output_files[0].unlink()
+            visualizer.generate_all_visualizations(test_file, use_cache=True)
+            assert load_aggregated.call_count == 1
+
+        stat = test_file.stat()
+        os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        with patch.object(visualizer, "_load_aggregated") as load_aggregated:
+            visualizer.generate_all_visualizations(test_file, use_cache=True)
+            assert load_aggregated.call_count == 1
+
+    def test_large_aggregated_file_is_memory_mapped(self, sample_aggregated_results_with_nones, tmp_path, monkeypatch):
+        """Test that memory-mapped and in-memory decoding agree, and empty files fail to decode."""
+        test_file = tmp_path / "test_aggregated.json"
+        test_file.write_bytes(msgspec.json.encode(sample_aggregated_results_with_nones))
+        in_memory = BenchmarkVisualizer(output_dir=tmp_path).generate_summary_metrics(test_file)
+
+        empty_file = tmp_path / "empty.json"
+        empty_file.touch()
+        with pytest.raises(msgspec.DecodeError):
+            BenchmarkVisualizer(output_dir=tmp_path).generate_summary_metrics(empty_file)
+
+        monkeypatch.setattr(BenchmarkVisualizer, "_MMAP_MIN_SIZE", 0)
+        assert BenchmarkVisualizer(output_dir=tmp_path).generate_summary_metrics(test_file) == in_memory
+
+    def test_failed_chart_closes_its_figure(self, sample_aggregated_results_with_nones, tmp_path):
+        """Test that a chart whose rendering fails does not leave its figure registered with pyplot."""
+        visualizer = BenchmarkVisualizer(output_dir=tmp_path)
+        summary_df = visualizer._build_summary_frame(sample_aggregated_results_with_nones)  # noqa: SLF001
+        open_figures = plt.get_fignums()
+
+        with patch("matplotlib.pyplot.savefig", side_effect=OSError("disk full")), pytest.raises(OSError, match="disk"):
+            visualizer._create_success_rate_chart(summary_df)  # noqa: SLF001
+
+        assert plt.get_fignums() == open_figures